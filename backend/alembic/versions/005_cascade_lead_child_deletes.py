@@ -0,0 +1,42 @@
+"""Cascade lead deletes to child tables
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables with a lead_id FK to leads.id (constraints use PostgreSQL's default naming)
+CHILD_TABLES = (
+    'activity_logs',
+    'email_drafts',
+    'feedbacks',
+    'traces',
+    'pipeline_runs',
+    'lead_outcome_stages',
+    'reply_classifications',
+    'notifications',
+)
+
+
+def upgrade() -> None:
+    for table in CHILD_TABLES:
+        name = f'{table}_lead_id_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, 'leads', ['lead_id'], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    for table in CHILD_TABLES:
+        name = f'{table}_lead_id_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, 'leads', ['lead_id'], ['id'])
@@ -0,0 +1,30 @@
+"""Add partial index for stale EMAIL_SENT lookups
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_leads_email_sent_entered_at',
+        'leads',
+        ['outcome_stage_entered_at'],
+        postgresql_where=sa.text("current_outcome_stage = 'EMAIL_SENT'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_leads_email_sent_entered_at', table_name='leads')
@@ -0,0 +1,44 @@
+"""Allow at most one open outcome stage record per lead
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Close any duplicate open records left by earlier concurrent transitions,
+    # keeping the most recently entered one open
+    op.execute(
+        """
+        UPDATE lead_outcome_stages AS s
+        SET exited_at = newer.entered_at
+        FROM lead_outcome_stages AS newer
+        WHERE s.lead_id = newer.lead_id
+          AND s.exited_at IS NULL
+          AND newer.exited_at IS NULL
+          AND (newer.entered_at, newer.id) > (s.entered_at, s.id)
+        """
+    )
+    op.create_index(
+        'ux_lead_outcome_stages_open_per_lead',
+        'lead_outcome_stages',
+        ['lead_id'],
+        unique=True,
+        postgresql_where=sa.text('exited_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ux_lead_outcome_stages_open_per_lead', table_name='lead_outcome_stages')
@@ -0,0 +1,40 @@
+"""Unique seeded demo lead email per demo session
+
+Revision ID: 009
+Revises: 007
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Marks the curated leads the demo seeder inserts. Existing rows predate the
+    # marker and stay FALSE, so the index below cannot reject them.
+    op.add_column(
+        'leads',
+        sa.Column('is_demo_seed', sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+    # Only seeded rows are unique per session; visitor uploads and manual
+    # creates may repeat an email
+    op.create_index(
+        'ux_leads_demo_session_email',
+        'leads',
+        ['demo_session_id', 'email'],
+        unique=True,
+        postgresql_where=sa.text('is_demo_seed'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ux_leads_demo_session_email', table_name='leads')
+    op.drop_column('leads', 'is_demo_seed')
@@ -0,0 +1,34 @@
+"""Add generated case-folded email column to leads
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'leads',
+        sa.Column(
+            'email_lower',
+            sa.String(length=255),
+            sa.Computed('lower(email)', persisted=True),
+        ),
+    )
+    op.create_index('ix_leads_email_lower', 'leads', ['email_lower'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_leads_email_lower', table_name='leads')
+    op.drop_column('leads', 'email_lower')
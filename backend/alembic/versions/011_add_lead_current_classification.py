@@ -0,0 +1,57 @@
+"""Point leads at their latest reply classification
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('leads', sa.Column('current_classification_id', sa.Uuid(), nullable=True))
+    op.create_foreign_key(
+        'leads_current_classification_id_fkey',
+        'leads',
+        'reply_classifications',
+        ['current_classification_id'],
+        ['id'],
+        ondelete='SET NULL',
+    )
+    # Backfill from existing classification history
+    op.execute("""
+        UPDATE leads
+        SET current_classification_id = latest.id
+        FROM (
+            SELECT DISTINCT ON (lead_id) id, lead_id
+            FROM reply_classifications
+            ORDER BY lead_id, created_at DESC
+        ) AS latest
+        WHERE latest.lead_id = leads.id
+    """)
+
+    # Serves the per-lead history listing (newest first)
+    op.create_index(
+        'ix_reply_classifications_lead_id_created_at',
+        'reply_classifications',
+        ['lead_id', sa.text('created_at DESC')],
+    )
+    op.drop_index('ix_reply_classifications_lead_id', table_name='reply_classifications')
+
+
+def downgrade() -> None:
+    op.create_index('ix_reply_classifications_lead_id', 'reply_classifications', ['lead_id'])
+    op.drop_index(
+        'ix_reply_classifications_lead_id_created_at', table_name='reply_classifications'
+    )
+    op.drop_constraint('leads_current_classification_id_fkey', 'leads', type_='foreignkey')
+    op.drop_column('leads', 'current_classification_id')
@@ -58,10 +58,8 @@ async def create_lead(
     demo_session_id: str | None = Depends(ensure_demo_leads),
 ) -> LeadResponse:
     """Create a new lead manually."""
-    result = await lead_service.create_lead(lead)
-    if demo_session_id:
-        result.demo_session_id = demo_session_id
-        await lead_service.session.flush()
+    # Tag the demo session on insert; a follow-up UPDATE would expire updated_at
+    result = await lead_service.create_lead(lead, demo_session_id=demo_session_id)
     return LeadResponse.model_validate(result)
 
 
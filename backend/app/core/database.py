@@ -1,6 +1,9 @@
+import asyncio
 import ssl as _ssl
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable
+from typing import Any
 
+from sqlalchemy import Engine, event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
@@ -31,11 +34,39 @@ else:
             _ssl_ctx.verify_mode = _ssl.CERT_NONE
         _engine_kwargs["connect_args"] = {"ssl": _ssl_ctx}
 
+
+def enable_sqlite_foreign_keys(sync_engine: Engine) -> None:
+    """Turn on FK enforcement for every new connection of a SQLite engine.
+
+    SQLite ignores FK constraints (and ON DELETE CASCADE) unless enabled per connection.
+    """
+
+    @event.listens_for(sync_engine, "connect")
+    def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):  # type: ignore[no-untyped-def]
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 engine = create_async_engine(_db_url, **_engine_kwargs)
 
+if _is_sqlite:
+    enable_sqlite_foreign_keys(engine.sync_engine)
+
 async_session_factory = async_sessionmaker(engine, expire_on_commit=False)
 
 
+async def gather_independent(*aws: Awaitable[Any]) -> list[Any]:
+    """Run awaitables that each open their own session, concurrently where possible.
+
+    Under SQLite's StaticPool every session shares one connection, so they
+    are awaited one after another instead.
+    """
+    if _is_sqlite:
+        return [await aw for aw in aws]
+    return list(await asyncio.gather(*aws))
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
         try:
@@ -38,10 +38,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Demo mode: clean up stale sessions and ensure admin/config exist
     if settings.AUTO_SEED_DEMO:
+        from app.core.database import gather_independent
         from app.services.demo_seeder import cleanup_old_sessions, ensure_admin_and_config
 
-        await cleanup_old_sessions()
-        await ensure_admin_and_config()
+        # Independent tables, separate sessions: safe to overlap
+        await gather_independent(cleanup_old_sessions(), ensure_admin_and_config())
 
     global _no_response_task
     _no_response_task = asyncio.create_task(_no_response_check_loop())
@@ -53,6 +54,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except asyncio.CancelledError:
             pass
 
+    from app.services.calendar_service import close_http_client
+
+    await close_http_client()
+
 
 def create_app() -> FastAPI:
     app = FastAPI(
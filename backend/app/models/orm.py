@@ -1,7 +1,20 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, Float, ForeignKey, Index, String, Text, Uuid, func
+from sqlalchemy import (
+    JSON,
+    Computed,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    Uuid,
+    false,
+    func,
+    text,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -28,12 +41,34 @@ class Lead(Base):
         Index("ix_leads_created_at", "created_at"),
         Index("ix_leads_current_outcome_stage", "current_outcome_stage"),
         Index("ix_leads_demo_session_id", "demo_session_id"),
+        Index("ix_leads_email_lower", "email_lower"),
+        # Makes per-session demo seeding idempotent (INSERT ... ON CONFLICT DO NOTHING).
+        # Scoped to seeded rows: visitors may still upload or create duplicates
+        Index(
+            "ux_leads_demo_session_email",
+            "demo_session_id",
+            "email",
+            unique=True,
+            postgresql_where=text("is_demo_seed"),
+            sqlite_where=text("is_demo_seed"),
+        ),
+        # Backs the daily NO_RESPONSE sweep (get_stale_email_sent)
+        Index(
+            "ix_leads_email_sent_entered_at",
+            "outcome_stage_entered_at",
+            postgresql_where=text("current_outcome_stage = 'EMAIL_SENT'"),
+            sqlite_where=text("current_outcome_stage = 'EMAIL_SENT'"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     first_name: Mapped[str] = mapped_column(String(255), nullable=False)
     last_name: Mapped[str] = mapped_column(String(255), nullable=False)
     email: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Case-folded copy of email maintained by the database; used for lookups only
+    email_lower: Mapped[str | None] = mapped_column(
+        String(255), Computed("lower(email)", persisted=True), deferred=True
+    )
     phone: Mapped[str | None] = mapped_column(String(50))
     company_name: Mapped[str] = mapped_column(String(255), nullable=False)
     job_title: Mapped[str | None] = mapped_column(String(255))
@@ -72,20 +107,44 @@ class Lead(Base):
 
     # Demo session isolation
     demo_session_id: Mapped[str | None] = mapped_column(String(36))
+    # True only for the curated leads the demo seeder inserts
+    is_demo_seed: Mapped[bool] = mapped_column(default=False, server_default=false())
+
+    # Latest reply classification, kept current by ReplyClassificationRepository.create
+    current_classification_id: Mapped[uuid.UUID | None] = mapped_column(
+        Uuid,
+        ForeignKey(
+            "reply_classifications.id",
+            ondelete="SET NULL",
+            use_alter=True,
+            name="leads_current_classification_id_fkey",
+        ),
+    )
 
-    # Relationships
-    activities: Mapped[list["ActivityLog"]] = relationship(back_populates="lead", lazy="selectin")
-    email_drafts: Mapped[list["EmailDraft"]] = relationship(back_populates="lead", lazy="selectin")
-    feedbacks: Mapped[list["Feedback"]] = relationship(back_populates="lead", lazy="selectin")
-    traces: Mapped[list["Trace"]] = relationship(back_populates="lead", lazy="selectin")
+    # Relationships (children are removed by ON DELETE CASCADE)
+    activities: Mapped[list["ActivityLog"]] = relationship(
+        back_populates="lead", lazy="selectin", passive_deletes=True
+    )
+    email_drafts: Mapped[list["EmailDraft"]] = relationship(
+        back_populates="lead", lazy="selectin", passive_deletes=True
+    )
+    feedbacks: Mapped[list["Feedback"]] = relationship(
+        back_populates="lead", lazy="selectin", passive_deletes=True
+    )
+    traces: Mapped[list["Trace"]] = relationship(
+        back_populates="lead", lazy="selectin", passive_deletes=True
+    )
     pipeline_runs: Mapped[list["PipelineRun"]] = relationship(
-        back_populates="lead", lazy="selectin"
+        back_populates="lead", lazy="selectin", passive_deletes=True
     )
     outcome_stages: Mapped[list["LeadOutcomeStage"]] = relationship(
-        back_populates="lead", lazy="selectin"
+        back_populates="lead", lazy="selectin", passive_deletes=True
     )
     reply_classifications: Mapped[list["ReplyClassificationRecord"]] = relationship(
-        back_populates="lead", lazy="select"
+        back_populates="lead",
+        lazy="select",
+        passive_deletes=True,
+        foreign_keys="ReplyClassificationRecord.lead_id",
     )
 
 
@@ -95,7 +154,7 @@ class ActivityLog(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     lead_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("leads.id"), nullable=False
+        Uuid, ForeignKey("leads.id", ondelete="CASCADE"), nullable=False
     )
     type: Mapped[str] = mapped_column(String(30), nullable=False)
     payload: Mapped[dict | None] = mapped_column(JSON)
@@ -110,7 +169,7 @@ class EmailDraft(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     lead_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("leads.id"), nullable=False
+        Uuid, ForeignKey("leads.id", ondelete="CASCADE"), nullable=False
     )
     subject: Mapped[str] = mapped_column(String(500), nullable=False)
     body: Mapped[str] = mapped_column(Text, nullable=False)
@@ -136,7 +195,7 @@ class Feedback(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     lead_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("leads.id"), nullable=False
+        Uuid, ForeignKey("leads.id", ondelete="CASCADE"), nullable=False
     )
     outcome: Mapped[str] = mapped_column(String(30), nullable=False)
     notes: Mapped[str | None] = mapped_column(Text)
@@ -151,7 +210,7 @@ class Trace(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     lead_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("leads.id"), nullable=False
+        Uuid, ForeignKey("leads.id", ondelete="CASCADE"), nullable=False
     )
     graph_run_id: Mapped[str] = mapped_column(String(255), nullable=False)
     node_events: Mapped[dict | None] = mapped_column(JSON)
@@ -168,7 +227,7 @@ class PipelineRun(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     lead_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("leads.id"), nullable=False
+        Uuid, ForeignKey("leads.id", ondelete="CASCADE"), nullable=False
     )
     thread_id: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     status: Mapped[str] = mapped_column(String(20), default="PENDING")
@@ -187,11 +246,19 @@ class LeadOutcomeStage(Base):
         Index("ix_lead_outcome_stages_stage", "stage"),
         Index("ix_lead_outcome_stages_entered_at", "entered_at"),
         Index("ix_lead_outcome_stages_lead_id_stage", "lead_id", "stage"),
+        # At most one open (not yet exited) stage record per lead
+        Index(
+            "ux_lead_outcome_stages_open_per_lead",
+            "lead_id",
+            unique=True,
+            postgresql_where=text("exited_at IS NULL"),
+            sqlite_where=text("exited_at IS NULL"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     lead_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("leads.id"), nullable=False
+        Uuid, ForeignKey("leads.id", ondelete="CASCADE"), nullable=False
     )
     stage: Mapped[str] = mapped_column(String(30), nullable=False)
     previous_stage: Mapped[str | None] = mapped_column(String(30))
@@ -219,11 +286,13 @@ class ScoringConfig(Base):
 
 class ReplyClassificationRecord(Base):
     __tablename__ = "reply_classifications"
-    __table_args__ = (Index("ix_reply_classifications_lead_id", "lead_id"),)
+    __table_args__ = (
+        Index("ix_reply_classifications_lead_id_created_at", "lead_id", text("created_at DESC")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     lead_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("leads.id"), nullable=False
+        Uuid, ForeignKey("leads.id", ondelete="CASCADE"), nullable=False
     )
     reply_body: Mapped[str] = mapped_column(Text, nullable=False)
     classification: Mapped[str] = mapped_column(String(30), nullable=False)
@@ -236,7 +305,9 @@ class ReplyClassificationRecord(Base):
     overridden_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
-    lead: Mapped["Lead"] = relationship(back_populates="reply_classifications")
+    lead: Mapped["Lead"] = relationship(
+        back_populates="reply_classifications", foreign_keys=[lead_id]
+    )
 
 
 class Notification(Base):
@@ -248,7 +319,7 @@ class Notification(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     lead_id: Mapped[uuid.UUID | None] = mapped_column(
-        Uuid, ForeignKey("leads.id"), nullable=True
+        Uuid, ForeignKey("leads.id", ondelete="CASCADE"), nullable=True
     )
     type: Mapped[str] = mapped_column(String(50), nullable=False)
     title: Mapped[str] = mapped_column(String(500), nullable=False)
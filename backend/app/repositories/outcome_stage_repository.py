@@ -1,9 +1,10 @@
 """Repository for lead outcome stage transitions."""
 
 import uuid
+from collections.abc import Sequence
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select, and_
+from sqlalchemy import and_, insert, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.enums import OutcomeStage
@@ -11,32 +12,32 @@ from app.models.orm import Lead, LeadOutcomeStage
 from app.repositories.base import BaseRepository
 
 # Valid transitions from each stage
-VALID_TRANSITIONS: dict[str, set[str]] = {
-    OutcomeStage.EMAIL_SENT.value: {
+VALID_TRANSITIONS: dict[str, frozenset[str]] = {
+    OutcomeStage.EMAIL_SENT.value: frozenset({
         OutcomeStage.RESPONDED.value,
         OutcomeStage.NO_RESPONSE.value,
         OutcomeStage.DISQUALIFIED.value,
         OutcomeStage.CLOSED_LOST.value,
-    },
-    OutcomeStage.RESPONDED.value: {
+    }),
+    OutcomeStage.RESPONDED.value: frozenset({
         OutcomeStage.BOOKED_DEMO.value,
         OutcomeStage.CLOSED_LOST.value,
         OutcomeStage.DISQUALIFIED.value,
-    },
-    OutcomeStage.BOOKED_DEMO.value: {
+    }),
+    OutcomeStage.BOOKED_DEMO.value: frozenset({
         OutcomeStage.CLOSED_WON.value,
         OutcomeStage.CLOSED_LOST.value,
-    },
-    OutcomeStage.NO_RESPONSE.value: {
+    }),
+    OutcomeStage.NO_RESPONSE.value: frozenset({
         OutcomeStage.RESPONDED.value,
-    },
-    OutcomeStage.CLOSED_WON.value: set(),  # terminal
-    OutcomeStage.CLOSED_LOST.value: {
+    }),
+    OutcomeStage.CLOSED_WON.value: frozenset(),  # terminal
+    OutcomeStage.CLOSED_LOST.value: frozenset({
         OutcomeStage.RESPONDED.value,  # re-engagement
-    },
-    OutcomeStage.DISQUALIFIED.value: {
+    }),
+    OutcomeStage.DISQUALIFIED.value: frozenset({
         OutcomeStage.RESPONDED.value,  # re-engagement
-    },
+    }),
 }
 
 
@@ -54,48 +55,76 @@ class OutcomeStageRepository(BaseRepository[LeadOutcomeStage]):
         metadata: dict | None = None,
     ) -> LeadOutcomeStage:
         """Close the current stage record, create a new one, and update the Lead."""
+        records = await self.transition_through(
+            lead_id, [(new_stage, reason, triggered_by, notes)], metadata=metadata
+        )
+        return records[0]
+
+    async def transition_through(
+        self,
+        lead_id: uuid.UUID,
+        stages: Sequence[tuple[str, str, str | None, str | None]],
+        metadata: dict | None = None,
+    ) -> list[LeadOutcomeStage]:
+        """Move a lead through one or more stages in order.
+
+        Each entry is ``(stage, reason, triggered_by, notes)``. Runs as three
+        statements without loading the Lead: the denormalized stage columns
+        are set to the final stage, the open stage record is closed with
+        RETURNING to recover the previous stage, and one record per stage is
+        inserted in a single batch. Intermediate records are closed as they
+        are written; entered_at is staggered by a microsecond per stage so the
+        history keeps its order.
+        """
+        if not stages:
+            raise ValueError("At least one stage is required")
+
         now = datetime.now(timezone.utc)
+        entered = [now + timedelta(microseconds=i) for i in range(len(stages))]
 
-        # Get the lead
-        lead = await self.session.get(Lead, lead_id)
-        if lead is None:
+        # Update denormalized fields on Lead
+        result = await self.session.execute(
+            update(Lead)
+            .where(Lead.id == lead_id)
+            .values(current_outcome_stage=stages[-1][0], outcome_stage_entered_at=entered[-1])
+        )
+        if result.rowcount == 0:
             raise ValueError(f"Lead {lead_id} not found")
 
-        previous_stage = lead.current_outcome_stage
-
-        # Close existing stage record (set exited_at)
-        if previous_stage:
-            stmt = select(LeadOutcomeStage).where(
+        # Close existing stage record (set exited_at); the partial unique index
+        # ux_lead_outcome_stages_open_per_lead guarantees at most one match
+        result = await self.session.execute(
+            update(LeadOutcomeStage)
+            .where(
                 and_(
                     LeadOutcomeStage.lead_id == lead_id,
-                    LeadOutcomeStage.stage == previous_stage,
                     LeadOutcomeStage.exited_at.is_(None),
                 )
             )
-            result = await self.session.execute(stmt)
-            current_record = result.scalars().first()
-            if current_record:
-                current_record.exited_at = now
-
-        # Create new stage record
-        new_record = LeadOutcomeStage(
-            lead_id=lead_id,
-            stage=new_stage,
-            previous_stage=previous_stage,
-            reason=reason,
-            triggered_by=triggered_by,
-            notes=notes,
-            metadata_json=metadata,
-            entered_at=now,
+            .values(exited_at=now)
+            .returning(LeadOutcomeStage.stage)
         )
-        self.session.add(new_record)
-
-        # Update denormalized fields on Lead
-        lead.current_outcome_stage = new_stage
-        lead.outcome_stage_entered_at = now
+        previous_stage = result.scalars().first()
 
-        await self.session.flush()
-        return new_record
+        # Create the new stage records
+        rows = []
+        for i, (stage, reason, triggered_by, notes) in enumerate(stages):
+            rows.append({
+                "lead_id": lead_id,
+                "stage": stage,
+                "previous_stage": previous_stage if i == 0 else stages[i - 1][0],
+                "reason": reason,
+                "triggered_by": triggered_by,
+                "notes": notes,
+                "metadata_json": metadata,
+                "entered_at": entered[i],
+                "exited_at": entered[i + 1] if i + 1 < len(stages) else None,
+            })
+        result = await self.session.scalars(
+            insert(LeadOutcomeStage).returning(LeadOutcomeStage, sort_by_parameter_order=True),
+            rows,
+        )
+        return list(result.all())
 
     async def get_stage_history(self, lead_id: uuid.UUID) -> list[LeadOutcomeStage]:
         """Get ordered list of all stage transitions for a lead."""
@@ -107,14 +136,27 @@ class OutcomeStageRepository(BaseRepository[LeadOutcomeStage]):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_latest_record(self, lead_id: uuid.UUID) -> LeadOutcomeStage | None:
+        """Get the most recent stage record for a lead without loading its history."""
+        stmt = (
+            select(LeadOutcomeStage)
+            .where(LeadOutcomeStage.lead_id == lead_id)
+            .order_by(LeadOutcomeStage.entered_at.desc())
+            .limit(1)
+        )
+        return await self.session.scalar(stmt)
+
     async def get_stale_email_sent(self, days: int = 14) -> list[Lead]:
         """Find leads stuck in EMAIL_SENT stage for more than N days."""
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        # Stage rendered inline (not as a bind param) so the planner can match
+        # the partial index ix_leads_email_sent_entered_at even for generic plans
         stmt = (
             select(Lead)
             .where(
                 and_(
-                    Lead.current_outcome_stage == OutcomeStage.EMAIL_SENT.value,
+                    Lead.current_outcome_stage
+                    == literal(OutcomeStage.EMAIL_SENT.value, literal_execute=True),
                     Lead.outcome_stage_entered_at <= cutoff,
                 )
             )
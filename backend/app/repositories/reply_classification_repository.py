@@ -2,11 +2,12 @@
 
 import uuid
 from datetime import datetime, timezone
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.orm import ReplyClassificationRecord
+from app.models.orm import Lead, ReplyClassificationRecord
 from app.repositories.base import BaseRepository
 
 
@@ -14,12 +15,21 @@ class ReplyClassificationRepository(BaseRepository[ReplyClassificationRecord]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, ReplyClassificationRecord)
 
+    async def create(self, **kwargs: Any) -> ReplyClassificationRecord:
+        record = await super().create(**kwargs)
+        # Point the lead at its newest classification
+        await self.session.execute(
+            update(Lead)
+            .where(Lead.id == record.lead_id)
+            .values(current_classification_id=record.id)
+        )
+        return record
+
     async def get_latest_for_lead(self, lead_id: uuid.UUID) -> ReplyClassificationRecord | None:
         stmt = (
             select(ReplyClassificationRecord)
-            .where(ReplyClassificationRecord.lead_id == lead_id)
-            .order_by(ReplyClassificationRecord.created_at.desc())
-            .limit(1)
+            .join(Lead, Lead.current_classification_id == ReplyClassificationRecord.id)
+            .where(Lead.id == lead_id)
         )
         result = await self.session.execute(stmt)
         return result.scalars().first()
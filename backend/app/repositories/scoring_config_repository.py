@@ -1,5 +1,9 @@
-from sqlalchemy import select
+import time
+from typing import Any
+
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from app.models.orm import ScoringConfig
 from app.repositories.base import BaseRepository
@@ -20,11 +24,59 @@ DEFAULT_THRESHOLDS = {
 }
 
 
+# Process-local cache of the active config: (detached copy, monotonic stamp).
+# Configs change rarely (settings page, feedback learning), so scoring reads
+# are served from here; writes through this repository drop the entry once
+# their transaction commits, and writes from other workers are picked up once
+# the TTL lapses.
+_CACHE_TTL = 30.0
+_CACHE: tuple[ScoringConfig, float] | None = None
+
+# Session.info flag set while a session holds an uncommitted config write
+_PENDING_WRITE = "scoring_config_pending_write"
+
+
+def _detached_copy(config: ScoringConfig) -> ScoringConfig:
+    # Transient instance bound to no session, with its own JSON dicts so
+    # callers can't mutate the cached entry
+    return ScoringConfig(
+        id=config.id,
+        weights=dict(config.weights),
+        thresholds=dict(config.thresholds),
+        updated_at=config.updated_at,
+        updated_by=config.updated_by,
+    )
+
+
+def clear_active_config_cache() -> None:
+    global _CACHE
+    _CACHE = None
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    if session.info.pop(_PENDING_WRITE, False):
+        clear_active_config_cache()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_write(session: Session) -> None:
+    # Rolled-back writes never reached the cache, so just drop the flag
+    session.info.pop(_PENDING_WRITE, None)
+
+
 class ScoringConfigRepository(BaseRepository[ScoringConfig]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, ScoringConfig)
 
     async def get_active(self) -> ScoringConfig:
+        global _CACHE
+        # A session with its own uncommitted write must see that write, and must
+        # not publish it to other sessions before it commits
+        pending = self.session.info.get(_PENDING_WRITE, False)
+        if not pending and _CACHE is not None and time.monotonic() - _CACHE[1] < _CACHE_TTL:
+            return _detached_copy(_CACHE[0])
+
         stmt = select(ScoringConfig).order_by(ScoringConfig.updated_at.desc()).limit(1)
         result = await self.session.execute(stmt)
         config = result.scalar_one_or_none()
@@ -33,4 +85,20 @@ class ScoringConfigRepository(BaseRepository[ScoringConfig]):
                 weights=DEFAULT_WEIGHTS,
                 thresholds=DEFAULT_THRESHOLDS,
             )
+            # updated_at is server-generated; load it before copying
+            await self.session.refresh(config, ["updated_at"])
+            return _detached_copy(config)
+
+        # Callers always get a detached copy, whether or not the cache was hit
+        copy = _detached_copy(config)
+        if not pending:
+            _CACHE = (_detached_copy(config), time.monotonic())
+        return copy
+
+    async def create(self, **kwargs: Any) -> ScoringConfig:
+        config = await super().create(**kwargs)
+        # The cache is cleared when this transaction commits (see
+        # _invalidate_on_commit), not now: clearing at flush time would let a
+        # reader re-cache a row that may still be rolled back
+        self.session.info[_PENDING_WRITE] = True
         return config
@@ -1,11 +1,15 @@
 """Calendar integration service with Calendly provider + mock fallback."""
 
 import abc
+import asyncio
 import hashlib
 import hmac
+import time
 import uuid
 
+import httpx
 import structlog
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -16,6 +20,40 @@ from app.repositories.outcome_stage_repository import OutcomeStageRepository
 
 logger = structlog.get_logger()
 
+# Stages from which a Calendly booking moves the lead to BOOKED_DEMO
+_BOOKABLE_STAGES: frozenset[str] = frozenset({
+    OutcomeStage.RESPONDED.value,
+    OutcomeStage.EMAIL_SENT.value,
+})
+
+# Shared client so Calendly calls reuse pooled keep-alive connections
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared Calendly HTTP client. Called on app shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# Scheduling links are effectively static per owner; cache successful lookups
+# for 10 minutes so the reply/send path doesn't hit Calendly every time
+_SCHEDULING_LINK_TTL = 600.0
+_scheduling_link_cache: dict[tuple[str, str | None], tuple[float, str]] = {}
+_scheduling_link_lock = asyncio.Lock()
+
 
 class CalendarProvider(abc.ABC):
     @abc.abstractmethod
@@ -37,44 +75,56 @@ class CalendlyProvider(CalendarProvider):
         self.user_uri = user_uri
 
     async def get_scheduling_link(self, event_type: str | None = None) -> str:
-        try:
-            import httpx
-
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    "https://api.calendly.com/scheduling_links",
-                    headers={"Authorization": f"Bearer {self.api_key}"},
-                    params={
-                        "owner": self.user_uri,
-                        "max_event_count": 1,
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                if data.get("resource", {}).get("booking_url"):
-                    return data["resource"]["booking_url"]
-        except Exception as e:
-            logger.warning("Calendly API call failed", error=str(e))
+        key = (self.user_uri, event_type)
+        cached = _scheduling_link_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        # Concurrent callers wait on one API call instead of each making their own
+        async with _scheduling_link_lock:
+            cached = _scheduling_link_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+
+            link = await self._fetch_scheduling_link()
+            if link:
+                _scheduling_link_cache[key] = (time.monotonic() + _SCHEDULING_LINK_TTL, link)
+                return link
 
         # Fallback to constructing a link from user URI
         slug = self.user_uri.rsplit("/", 1)[-1] if self.user_uri else "user"
         return f"https://calendly.com/{slug}"
 
+    async def _fetch_scheduling_link(self) -> str | None:
+        try:
+            resp = await _get_http_client().get(
+                "https://api.calendly.com/scheduling_links",
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                params={
+                    "owner": self.user_uri,
+                    "max_event_count": 1,
+                },
+            )
+            resp.raise_for_status()
+            data = resp.json()
+            if data.get("resource", {}).get("booking_url"):
+                return data["resource"]["booking_url"]
+        except Exception as e:
+            logger.warning("Calendly API call failed", error=str(e))
+        return None
+
     async def check_availability(self, date_range: dict) -> list[dict]:
         # Calendly doesn't have a direct availability API for external use
         return []
 
     async def get_event(self, event_id: str) -> dict | None:
         try:
-            import httpx
-
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    f"https://api.calendly.com/scheduled_events/{event_id}",
-                    headers={"Authorization": f"Bearer {self.api_key}"},
-                )
-                resp.raise_for_status()
-                return resp.json().get("resource")
+            resp = await _get_http_client().get(
+                f"https://api.calendly.com/scheduled_events/{event_id}",
+                headers={"Authorization": f"Bearer {self.api_key}"},
+            )
+            resp.raise_for_status()
+            return resp.json().get("resource")
         except Exception as e:
             logger.warning("Failed to fetch Calendly event", error=str(e))
             return None
@@ -132,40 +182,42 @@ class CalendarService:
             logger.warning("Webhook missing invitee email")
             return {"status": "ignored", "reason": "no email"}
 
-        # Look up lead by email
-        from sqlalchemy import select
-
-        stmt = select(Lead).where(Lead.email == email).limit(1)
+        # Look up lead by email. Only the id and stage are needed, so select those
+        # columns rather than a Lead entity (and its selectin collections)
+        stmt = (
+            select(Lead.id, Lead.current_outcome_stage)
+            .where(Lead.email_lower == email)
+            .limit(1)
+        )
         result = await self.session.execute(stmt)
-        lead = result.scalars().first()
+        row = result.first()
 
-        if not lead:
+        if not row:
             logger.info("Webhook email not matched to lead", email=email)
             return {"status": "ignored", "reason": "no matching lead"}
 
+        lead_id, current = row
+
         # Transition to BOOKED_DEMO
-        current = lead.current_outcome_stage
-        if current in {OutcomeStage.RESPONDED.value, OutcomeStage.EMAIL_SENT.value}:
+        if current in _BOOKABLE_STAGES:
+            stages = [(
+                OutcomeStage.BOOKED_DEMO.value,
+                "AUTOMATIC",
+                "calendly_webhook",
+                f"Demo booked via Calendly. Event: {event_uri}",
+            )]
             # If EMAIL_SENT, transition through RESPONDED first
             if current == OutcomeStage.EMAIL_SENT.value:
-                await self.stage_repo.transition_to_stage(
-                    lead_id=lead.id,
-                    new_stage=OutcomeStage.RESPONDED.value,
-                    reason="AUTOMATIC",
-                    triggered_by="calendly_webhook",
-                    notes="Auto-transitioned on demo booking",
-                )
-
-            await self.stage_repo.transition_to_stage(
-                lead_id=lead.id,
-                new_stage=OutcomeStage.BOOKED_DEMO.value,
-                reason="AUTOMATIC",
-                triggered_by="calendly_webhook",
-                notes=f"Demo booked via Calendly. Event: {event_uri}",
-            )
+                stages.insert(0, (
+                    OutcomeStage.RESPONDED.value,
+                    "AUTOMATIC",
+                    "calendly_webhook",
+                    "Auto-transitioned on demo booking",
+                ))
+            await self.stage_repo.transition_through(lead_id, stages)
 
             await self.activity_repo.create(
-                lead_id=lead.id,
+                lead_id=lead_id,
                 type=ActivityType.DEMO_BOOKED.value,
                 payload={
                     "event_uri": event_uri,
@@ -174,12 +226,12 @@ class CalendarService:
                 },
             )
 
-            logger.info("Demo booked via webhook", lead_id=str(lead.id))
-            return {"status": "booked", "lead_id": str(lead.id)}
+            logger.info("Demo booked via webhook", lead_id=str(lead_id))
+            return {"status": "booked", "lead_id": str(lead_id)}
 
         logger.info(
             "Lead not in bookable stage",
-            lead_id=str(lead.id),
+            lead_id=str(lead_id),
             current_stage=current,
         )
         return {"status": "ignored", "reason": f"lead in stage {current}"}
@@ -188,9 +240,13 @@ class CalendarService:
     def verify_webhook_signature(payload_body: bytes, signature: str) -> bool:
         if not settings.CALENDLY_WEBHOOK_SECRET:
             return True  # No secret configured, skip verification
+        try:
+            received = bytes.fromhex(signature)
+        except ValueError:
+            return False  # not a hex digest, can't match
         expected = hmac.new(
             settings.CALENDLY_WEBHOOK_SECRET.encode(),
             payload_body,
             hashlib.sha256,
-        ).hexdigest()
-        return hmac.compare_digest(expected, signature)
+        ).digest()
+        return hmac.compare_digest(expected, received)
@@ -5,30 +5,19 @@ Each visitor gets their own set of 6 unscored leads tagged with a unique
 demo_session_id. Old sessions (>24h) are cleaned up on startup.
 """
 
-import asyncio
 import csv
 import hashlib
 import logging
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import Insert, delete, exists, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import async_session_factory
-from app.models.orm import (
-    ActivityLog,
-    EmailDraft,
-    Feedback,
-    Lead,
-    LeadOutcomeStage,
-    Notification,
-    PipelineRun,
-    ReplyClassificationRecord,
-    ScoringConfig,
-    Trace,
-    User,
-)
+from app.core.database import async_session_factory, gather_independent
+from app.models.orm import Lead, ScoringConfig, User
 
 logger = logging.getLogger("leadops.demo_seeder")
 
@@ -41,10 +30,48 @@ CSV_PATH = (
     else _HERE / "data" / "demo_leads_curated.csv"  # Docker (/app/data/)
 )
 
-# In-memory set of session IDs that have been seeded (avoids DB round-trip per request)
-_seeded_sessions: set[str] = set()
-# Per-session locks to prevent concurrent double-seeding
-_seed_locks: dict[str, asyncio.Lock] = {}
+# Hash of the default dev API key for the seeded admin user
+_DEFAULT_ADMIN_API_KEY_HASH = hashlib.sha256(b"dev-api-key-change-me").hexdigest()
+
+# CSV column -> (max length, value stored when blank). Lengths follow the
+# String column definitions on leads; Text columns carry their own cap.
+FIELD_SPECS: tuple[tuple[str, int, str | None], ...] = tuple(
+    (name, Lead.__table__.c[name].type.length or text_cap, blank)
+    for name, text_cap, blank in (
+        ("first_name", None, ""),
+        ("last_name", None, ""),
+        ("email", None, ""),
+        ("phone", None, None),
+        ("company_name", None, "Unknown"),
+        ("job_title", None, None),
+        ("industry", None, None),
+        ("company_size", None, None),
+        ("country", None, None),
+        ("source", None, None),
+        ("budget_range", None, None),
+        ("pain_point", 500, None),
+        ("urgency", None, None),
+        ("lead_message", 2000, None),
+    )
+)
+
+# Parsed, truncated CSV rows shared by every session; filled on first seed
+_curated_rows: tuple[dict[str, str | None], ...] | None = None
+
+
+def _load_curated_rows() -> tuple[dict[str, str | None], ...]:
+    global _curated_rows
+    if _curated_rows is None:
+        if not CSV_PATH.exists():
+            logger.error("Curated CSV not found at %s", CSV_PATH)
+            return ()
+        with open(CSV_PATH, "r", encoding="utf-8") as f:
+            _curated_rows = tuple(
+                {name: row.get(name, "")[:limit] or blank for name, limit, blank in FIELD_SPECS}
+                for row in csv.DictReader(f)
+                if row.get("email") and row.get("first_name")
+            )
+    return _curated_rows
 
 
 async def cleanup_old_sessions() -> None:
@@ -52,116 +79,80 @@ async def cleanup_old_sessions() -> None:
     try:
         cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
         async with async_session_factory() as session:
-            # Find old demo leads
-            old_lead_ids_stmt = (
-                select(Lead.id)
+            # Child rows go with their lead via ON DELETE CASCADE
+            result = await session.execute(
+                delete(Lead)
                 .where(Lead.demo_session_id.is_not(None))
                 .where(Lead.created_at < cutoff)
             )
-            result = await session.execute(old_lead_ids_stmt)
-            old_lead_ids = [row[0] for row in result.all()]
+            await session.commit()
 
-            if not old_lead_ids:
+            if result.rowcount:
+                logger.info("Cleaned up %d stale demo leads", result.rowcount)
+            else:
                 logger.info("No stale demo sessions to clean up")
-                return
-
-            # Delete children first (FK safety)
-            for child_model in (
-                Notification, ReplyClassificationRecord, LeadOutcomeStage,
-                PipelineRun, Trace, Feedback, EmailDraft, ActivityLog,
-            ):
-                await session.execute(
-                    delete(child_model).where(child_model.lead_id.in_(old_lead_ids))
-                )
-
-            # Delete the leads themselves
-            await session.execute(
-                delete(Lead).where(Lead.id.in_(old_lead_ids))
-            )
-            await session.commit()
-            logger.info("Cleaned up %d stale demo leads", len(old_lead_ids))
     except Exception:
         logger.exception("Demo session cleanup failed")
 
 
 async def seed_for_session(session_id: str, db: AsyncSession) -> None:
-    """Insert 6 curated leads tagged with demo_session_id for this visitor."""
-    if session_id in _seeded_sessions:
+    """Insert 6 curated leads tagged with demo_session_id for this visitor.
+
+    Idempotent across requests and workers: the unique index on
+    (demo_session_id, email) over seeded rows plus ON CONFLICT DO NOTHING
+    means concurrent first requests for a session cannot double-seed.
+    """
+    # Already seeded: one index probe, no write
+    if await db.scalar(select(exists().where(Lead.demo_session_id == session_id))):
         return
 
-    # Per-session lock prevents concurrent requests from double-seeding
-    if session_id not in _seed_locks:
-        _seed_locks[session_id] = asyncio.Lock()
-    async with _seed_locks[session_id]:
-        # Re-check after acquiring lock (another request may have seeded)
-        if session_id in _seeded_sessions:
-            return
-
-        # DB fallback: check if leads already exist for this session
-        result = await db.execute(
-            select(func.count()).select_from(Lead).where(Lead.demo_session_id == session_id)
-        )
-        if result.scalar_one() > 0:
-            _seeded_sessions.add(session_id)
-            return
+    rows = [
+        {**row, "status": "NEW", "demo_session_id": session_id, "is_demo_seed": True}
+        for row in _load_curated_rows()
+    ]
 
-        if not CSV_PATH.exists():
-            logger.error("Curated CSV not found at %s", CSV_PATH)
-            return
+    # Single Core executemany against the table: no per-lead unit-of-work
+    # INSERTs and no ORM bulk-persistence bookkeeping
+    if rows:
+        await db.execute(_insert_ignoring_seeded(db), rows)
+    logger.info("Seeded %d leads for demo session %s", len(rows), session_id[:8])
 
-        lead_count = 0
-        with open(CSV_PATH, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if not row.get("email") or not row.get("first_name"):
-                    continue
-                lead = Lead(
-                    first_name=row["first_name"][:100],
-                    last_name=row["last_name"][:100],
-                    email=row["email"][:255],
-                    phone=row.get("phone", "")[:50] or None,
-                    company_name=row.get("company_name", "")[:200] or "Unknown",
-                    job_title=row.get("job_title", "")[:100] or None,
-                    industry=row.get("industry", "")[:100] or None,
-                    company_size=row.get("company_size", "")[:50] or None,
-                    country=row.get("country", "")[:100] or None,
-                    source=row.get("source", "")[:100] or None,
-                    budget_range=row.get("budget_range", "")[:50] or None,
-                    pain_point=row.get("pain_point", "")[:500] or None,
-                    urgency=row.get("urgency", "")[:20] or None,
-                    lead_message=row.get("lead_message", "")[:2000] or None,
-                    status="NEW",
-                    demo_session_id=session_id,
-                )
-                db.add(lead)
-                lead_count += 1
-
-        await db.flush()
-        _seeded_sessions.add(session_id)
-        logger.info("Seeded %d leads for demo session %s", lead_count, session_id[:8])
+
+def _insert_ignoring_seeded(db: AsyncSession) -> Insert:
+    """INSERT into leads that skips rows already seeded for the session."""
+    if db.get_bind().dialect.name == "sqlite":
+        stmt = sqlite_insert(Lead.__table__)
+    else:
+        stmt = pg_insert(Lead.__table__)
+    return stmt.on_conflict_do_nothing(
+        index_elements=["demo_session_id", "email"],
+        index_where=text("is_demo_seed"),
+    )
 
 
 async def ensure_admin_and_config() -> None:
     """Create admin user and scoring config if they don't already exist."""
+    # Disjoint tables: overlap them, each on its own session/connection
+    await gather_independent(_ensure_admin(), _ensure_scoring_config())
+
+
+async def _ensure_admin() -> None:
     async with async_session_factory() as session:
-        # Admin user — skip if exists
-        result = await session.execute(
-            select(func.count()).select_from(User).where(User.email == "admin@leadops.dev")
-        )
-        if result.scalar_one() == 0:
-            api_key_hash = hashlib.sha256(b"dev-api-key-change-me").hexdigest()
+        if not await session.scalar(
+            select(exists().where(User.email == "admin@leadops.dev"))
+        ):
             session.add(User(
                 email="admin@leadops.dev",
                 name="Admin User",
-                api_key_hash=api_key_hash,
+                api_key_hash=_DEFAULT_ADMIN_API_KEY_HASH,
                 is_active=True,
             ))
+            await session.commit()
+
 
-        # Scoring config — skip if exists
-        result = await session.execute(
-            select(func.count()).select_from(ScoringConfig)
-        )
-        if result.scalar_one() == 0:
+async def _ensure_scoring_config() -> None:
+    async with async_session_factory() as session:
+        if not await session.scalar(select(exists().select_from(ScoringConfig))):
             session.add(ScoringConfig(
                 weights={
                     "urgency": 2.5,
@@ -177,5 +168,4 @@ async def ensure_admin_and_config() -> None:
                     "warm": 50,
                 },
             ))
-
-        await session.commit()
+            await session.commit()
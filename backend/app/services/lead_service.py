@@ -19,7 +19,7 @@ class LeadService:
         self.lead_repo = LeadRepository(session)
         self.activity_repo = ActivityRepository(session)
 
-    async def create_lead(self, data: LeadCreate) -> Lead:
+    async def create_lead(self, data: LeadCreate, demo_session_id: str | None = None) -> Lead:
         """
         Create a new lead and log INGESTED activity.
         """
@@ -41,6 +41,7 @@ class LeadService:
             urgency=data.urgency.value if data.urgency else None,
             lead_message=data.lead_message,
             status=LeadStatus.NEW.value,
+            demo_session_id=demo_session_id,
         )
 
         await self.activity_repo.create(
@@ -151,10 +152,7 @@ class LeadService:
                     lead_message=sanitized_row.get("lead_message"),
                 )
 
-                lead = await self.create_lead(lead_data)
-                if demo_session_id:
-                    lead.demo_session_id = demo_session_id
-                    await self.session.flush()
+                await self.create_lead(lead_data, demo_session_id=demo_session_id)
                 created_count += 1
 
             except Exception as e:
@@ -58,7 +58,7 @@ class OutcomeService:
         if current is None:
             raise ValueError("Lead has no outcome stage yet. Email must be sent first.")
 
-        valid_next = VALID_TRANSITIONS.get(current, set())
+        valid_next = VALID_TRANSITIONS.get(current, frozenset())
         if new_stage_val not in valid_next:
             raise ValueError(
                 f"Invalid transition from {current} to {new_stage_val}. "
@@ -122,8 +122,8 @@ class OutcomeService:
                 current_stage=lead.current_outcome_stage,
             )
             # Return the existing current stage record
-            history = await self.stage_repo.get_stage_history(lead_id)
-            return history[-1] if history else await self.stage_repo.transition_to_stage(
+            latest = await self.stage_repo.get_latest_record(lead_id)
+            return latest if latest is not None else await self.stage_repo.transition_to_stage(
                 lead_id=lead_id,
                 new_stage=OutcomeStage.EMAIL_SENT.value,
                 reason="SYSTEM",
@@ -379,5 +379,5 @@ class OutcomeService:
         if current is None:
             return None, []
 
-        valid_next = VALID_TRANSITIONS.get(current, set())
+        valid_next = VALID_TRANSITIONS.get(current, frozenset())
         return current, sorted(valid_next)
@@ -13,6 +13,15 @@ logger = structlog.get_logger()
 # Regex pattern for email addresses
 EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
 
+# Leaf types _redact_pii copies through without further checks
+_SCALAR_TYPES = frozenset({int, float, bool, type(None)})
+
+
+def _replace_email(match: re.Match) -> str:
+    # Module-level so EMAIL_PATTERN.sub doesn't get a fresh closure per string
+    hashed = TraceService.hash_email(match.group(0))
+    return f"REDACTED_{hashed[:16]}"  # Use first 16 chars of hash for readability
+
 
 class TraceService:
     def __init__(self, session: AsyncSession):
@@ -76,9 +85,11 @@ class TraceService:
 
     def _redact_pii(self, data: dict) -> dict:
         """
-        Recursively redact PII (email addresses) from nested dictionary.
+        Redact PII (email addresses) from a nested dictionary.
 
         Replaces email addresses with their SHA256 hash prefixed with "REDACTED_".
+        Walks nested dicts and lists with an explicit stack, and redacts each
+        distinct string once even if it appears in several places.
 
         Args:
             data: Dictionary potentially containing PII
@@ -89,22 +100,37 @@ class TraceService:
         if not isinstance(data, dict):
             return data
 
-        redacted = {}
-        for key, value in data.items():
-            if isinstance(value, dict):
-                # Recursively redact nested dicts
-                redacted[key] = self._redact_pii(value)
-            elif isinstance(value, list):
-                # Handle lists
-                redacted[key] = [
-                    self._redact_pii(item) if isinstance(item, dict) else self._redact_pii_string(item)
-                    for item in value
-                ]
-            elif isinstance(value, str):
-                # Redact emails in strings
-                redacted[key] = self._redact_pii_string(value)
-            else:
-                redacted[key] = value
+        memo: dict[str, str] = {}
+        redacted: dict = {}
+        # (source, copy) container pairs still to fill; the input is never mutated
+        stack: list[tuple[dict | list, dict | list]] = [(data, redacted)]
+        while stack:
+            source, target = stack.pop()
+            items = source.items() if isinstance(source, dict) else enumerate(source)
+            for key, value in items:
+                # Exact type checks first: JSON-shaped payloads almost never hold
+                # subclasses, and ints/bools/None skip straight to the copy
+                t = type(value)
+                if t in _SCALAR_TYPES:
+                    target[key] = value
+                    continue
+                if t is not str and t is not dict and t is not list:
+                    # Rare subclass (or unknown leaf): fall back to isinstance
+                    t = next((b for b in (str, dict, list) if isinstance(value, b)), None)
+
+                if t is str:
+                    copied = memo.get(value)
+                    if copied is None:
+                        copied = memo[value] = self._redact_pii_string(value)
+                elif t is dict:
+                    copied = {}
+                    stack.append((value, copied))
+                elif t is list:
+                    copied = [None] * len(value)
+                    stack.append((value, copied))
+                else:
+                    copied = value
+                target[key] = copied
 
         return redacted
 
@@ -118,15 +144,12 @@ class TraceService:
         Returns:
             String with emails replaced by hashed versions
         """
-        if not text or not isinstance(text, str):
+        # Most trace strings carry no address at all; a substring check is far
+        # cheaper than running the pattern over them
+        if not isinstance(text, str) or "@" not in text:
             return text
 
-        def replace_email(match):
-            email = match.group(0)
-            hashed = self.hash_email(email)
-            return f"REDACTED_{hashed[:16]}"  # Use first 16 chars of hash for readability
-
-        return EMAIL_PATTERN.sub(replace_email, text)
+        return EMAIL_PATTERN.sub(_replace_email, text)
 
     @staticmethod
     def hash_email(email: str) -> str:
@@ -21,6 +21,10 @@ class HeuristicEnrichmentProvider:
     }
 
     async def enrich(self, email: str, company: str) -> dict:
+        return self.enrich_sync(email, company)
+
+    def enrich_sync(self, email: str, company: str) -> dict:
+        """Pure string heuristics; no I/O, so callable without an event loop."""
         domain = email.split("@")[-1].lower() if "@" in email else ""
         company_lower = company.lower()
 
@@ -12,16 +12,26 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.core.config import settings
+from app.core.database import enable_sqlite_foreign_keys
 from app.models.orm import Base
 from app.main import create_app
 from app.models.enums import LeadSource, LeadStatus, ScoreLabel, Urgency
 from app.models.schemas import LeadCreate
+from app.repositories.scoring_config_repository import clear_active_config_cache
 
 
 # Test database URL - using in-memory SQLite for unit tests
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
+@pytest.fixture(autouse=True)
+def _clear_active_config_cache():
+    """Reset the process-wide scoring config cache so no test sees another's database."""
+    clear_active_config_cache()
+    yield
+    clear_active_config_cache()
+
+
 @pytest_asyncio.fixture
 async def test_engine():
     """Create test database engine."""
@@ -30,6 +40,8 @@ async def test_engine():
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+    # Same FK enforcement as the app's SQLite engine, so ON DELETE CASCADE applies
+    enable_sqlite_foreign_keys(engine.sync_engine)
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -297,3 +297,58 @@ async def test_cors_headers(test_client: AsyncClient):
 
     # CORS preflight should return 200
     assert response.status_code in [200, 204, 400]
+
+
+# --- Demo mode (per-session seeded leads) ---
+
+_DEMO_HEADERS = {"X-Demo-Session": "7b0c7a52-2f0e-4c55-9b8e-6c1f1b7a9d10"}
+# Also one of the curated leads seeded into every demo session
+_SEEDED_EMAIL = "sarah.chen@techflow.io"
+
+
+@pytest.fixture
+def demo_mode(monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "AUTO_SEED_DEMO", True)
+
+
+@pytest.mark.asyncio
+async def test_demo_upload_csv_allows_seeded_and_repeated_emails(
+    test_client: AsyncClient, api_key_header: dict, demo_mode
+):
+    """Uploads may repeat a seeded email or an email within the file."""
+    csv_content = f"""first_name,last_name,email,company_name
+Sarah,Chen,{_SEEDED_EMAIL},TechFlow Solutions
+John,Doe,john@example.com,Acme Corp
+John,Doe,john@example.com,Acme Corp"""
+
+    response = await test_client.post(
+        "/api/v1/leads/upload",
+        files={"file": ("leads.csv", csv_content, "text/csv")},
+        headers={**api_key_header, **_DEMO_HEADERS},
+    )
+
+    assert response.status_code == 201
+    assert response.json() == {"created": 3, "errors": []}
+
+
+@pytest.mark.asyncio
+async def test_demo_create_lead_with_seeded_email(
+    test_client: AsyncClient, api_key_header: dict, demo_mode
+):
+    """A manual create may reuse an email already seeded into the session."""
+    lead_data = {
+        "first_name": "Sarah",
+        "last_name": "Chen",
+        "email": _SEEDED_EMAIL,
+        "company_name": "TechFlow Solutions",
+    }
+    headers = {**api_key_header, **_DEMO_HEADERS}
+
+    first = await test_client.post("/api/v1/leads", json=lead_data, headers=headers)
+    second = await test_client.post("/api/v1/leads", json=lead_data, headers=headers)
+
+    assert first.status_code == 201
+    assert second.status_code == 201
+    assert first.json()["id"] != second.json()["id"]
@@ -3,12 +3,15 @@
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from app.models.enums import ActivityType, OutcomeStage
-from app.models.orm import Lead, LeadOutcomeStage
+from app.models.orm import Lead
+from app.services import calendar_service as calendar_module
 from app.services.calendar_service import (
     CalendarService,
+    CalendlyProvider,
     MockCalendarProvider,
     _get_provider,
 )
@@ -58,6 +61,15 @@ def _make_lead(lead_id=None, current_stage="EMAIL_SENT", email="jane@acme.com"):
     )
 
 
+def _mock_lookup(mock_session, lead):
+    # The webhook selects (id, current_outcome_stage) rows, not Lead entities
+    mock_result = MagicMock()
+    mock_result.first.return_value = (
+        (lead.id, lead.current_outcome_stage) if lead is not None else None
+    )
+    mock_session.execute.return_value = mock_result
+
+
 # --- get_booking_link ---
 
 
@@ -103,6 +115,98 @@ async def test_mock_provider_get_event():
     assert event["id"] == "evt-123"
 
 
+# --- CalendlyProvider ---
+
+
+@pytest.fixture(autouse=True)
+def _clear_scheduling_link_cache():
+    calendar_module._scheduling_link_cache.clear()
+    yield
+    calendar_module._scheduling_link_cache.clear()
+
+
+def _mock_http_client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_calendly_scheduling_link_uses_shared_client():
+    def handler(request):
+        assert request.headers["Authorization"] == "Bearer key"
+        return httpx.Response(
+            200, json={"resource": {"booking_url": "https://calendly.com/acme/30min"}}
+        )
+
+    client = _mock_http_client(handler)
+    provider = CalendlyProvider(api_key="key", user_uri="https://api.calendly.com/users/acme")
+
+    with patch.object(calendar_module, "_get_http_client", return_value=client):
+        link = await provider.get_scheduling_link()
+
+    assert link == "https://calendly.com/acme/30min"
+    assert not client.is_closed  # shared client is not closed per call
+
+
+@pytest.mark.asyncio
+async def test_calendly_scheduling_link_falls_back_on_error():
+    client = _mock_http_client(lambda request: httpx.Response(500))
+    provider = CalendlyProvider(api_key="key", user_uri="https://api.calendly.com/users/acme")
+
+    with patch.object(calendar_module, "_get_http_client", return_value=client):
+        link = await provider.get_scheduling_link()
+
+    assert link == "https://calendly.com/acme"
+
+
+@pytest.mark.asyncio
+async def test_calendly_scheduling_link_cached():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(
+            200, json={"resource": {"booking_url": "https://calendly.com/acme/30min"}}
+        )
+
+    client = _mock_http_client(handler)
+    provider = CalendlyProvider(api_key="key", user_uri="https://api.calendly.com/users/acme")
+
+    with patch.object(calendar_module, "_get_http_client", return_value=client):
+        links = [await provider.get_scheduling_link() for _ in range(3)]
+
+    assert links == ["https://calendly.com/acme/30min"] * 3
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_calendly_fallback_link_not_cached():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(500)
+
+    client = _mock_http_client(handler)
+    provider = CalendlyProvider(api_key="key", user_uri="https://api.calendly.com/users/acme")
+
+    with patch.object(calendar_module, "_get_http_client", return_value=client):
+        await provider.get_scheduling_link()
+        await provider.get_scheduling_link()
+
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_close_http_client_resets_shared_client():
+    client = calendar_module._get_http_client()
+    assert calendar_module._get_http_client() is client
+
+    await calendar_module.close_http_client()
+
+    assert client.is_closed
+    assert calendar_module._http_client is None
+
+
 # --- _get_provider ---
 
 
@@ -122,17 +226,8 @@ async def test_webhook_books_demo_from_email_sent(
 ):
     lead = _make_lead(current_stage=OutcomeStage.EMAIL_SENT.value, email="jane@acme.com")
 
-    # Mock session.execute for the SELECT query
-    mock_result = MagicMock()
-    mock_scalars = MagicMock()
-    mock_scalars.first.return_value = lead
-    mock_result.scalars.return_value = mock_scalars
-    mock_session.execute.return_value = mock_result
-
-    mock_stage_repo.transition_to_stage.return_value = LeadOutcomeStage(
-        id=uuid.uuid4(), lead_id=lead.id, stage=OutcomeStage.BOOKED_DEMO.value,
-        reason="AUTOMATIC", triggered_by="calendly_webhook",
-    )
+    # Mock session.execute for the (id, stage) SELECT
+    _mock_lookup(mock_session, lead)
 
     result = await calendar_service.handle_booking_webhook({
         "payload": {
@@ -142,14 +237,14 @@ async def test_webhook_books_demo_from_email_sent(
     })
 
     assert result["status"] == "booked"
-    # Should transition through RESPONDED then BOOKED_DEMO (2 calls)
-    assert mock_stage_repo.transition_to_stage.call_count == 2
-
-    first_transition = mock_stage_repo.transition_to_stage.call_args_list[0].kwargs
-    assert first_transition["new_stage"] == OutcomeStage.RESPONDED.value
-
-    second_transition = mock_stage_repo.transition_to_stage.call_args_list[1].kwargs
-    assert second_transition["new_stage"] == OutcomeStage.BOOKED_DEMO.value
+    # Should transition through RESPONDED then BOOKED_DEMO in one call
+    mock_stage_repo.transition_through.assert_called_once()
+    lead_id, stages = mock_stage_repo.transition_through.call_args.args
+    assert lead_id == lead.id
+    assert [s[0] for s in stages] == [
+        OutcomeStage.RESPONDED.value,
+        OutcomeStage.BOOKED_DEMO.value,
+    ]
 
     # DEMO_BOOKED activity logged
     mock_activity_repo.create.assert_called_once()
@@ -163,26 +258,17 @@ async def test_webhook_books_demo_from_responded(
 ):
     lead = _make_lead(current_stage=OutcomeStage.RESPONDED.value, email="jane@acme.com")
 
-    mock_result = MagicMock()
-    mock_scalars = MagicMock()
-    mock_scalars.first.return_value = lead
-    mock_result.scalars.return_value = mock_scalars
-    mock_session.execute.return_value = mock_result
-
-    mock_stage_repo.transition_to_stage.return_value = LeadOutcomeStage(
-        id=uuid.uuid4(), lead_id=lead.id, stage=OutcomeStage.BOOKED_DEMO.value,
-        reason="AUTOMATIC", triggered_by="calendly_webhook",
-    )
+    _mock_lookup(mock_session, lead)
 
     result = await calendar_service.handle_booking_webhook({
         "payload": {"email": "jane@acme.com", "event": "evt-456"}
     })
 
     assert result["status"] == "booked"
-    # Should go directly to BOOKED_DEMO (1 call, no intermediate RESPONDED)
-    assert mock_stage_repo.transition_to_stage.call_count == 1
-    kwargs = mock_stage_repo.transition_to_stage.call_args.kwargs
-    assert kwargs["new_stage"] == OutcomeStage.BOOKED_DEMO.value
+    # Should go directly to BOOKED_DEMO (no intermediate RESPONDED)
+    mock_stage_repo.transition_through.assert_called_once()
+    _, stages = mock_stage_repo.transition_through.call_args.args
+    assert [s[0] for s in stages] == [OutcomeStage.BOOKED_DEMO.value]
 
 
 @pytest.mark.asyncio
@@ -197,11 +283,7 @@ async def test_webhook_no_email_ignored(calendar_service, mock_session):
 
 @pytest.mark.asyncio
 async def test_webhook_no_matching_lead(calendar_service, mock_session):
-    mock_result = MagicMock()
-    mock_scalars = MagicMock()
-    mock_scalars.first.return_value = None
-    mock_result.scalars.return_value = mock_scalars
-    mock_session.execute.return_value = mock_result
+    _mock_lookup(mock_session, None)
 
     result = await calendar_service.handle_booking_webhook({
         "payload": {"email": "unknown@example.com", "event": "evt-000"}
@@ -215,11 +297,7 @@ async def test_webhook_no_matching_lead(calendar_service, mock_session):
 async def test_webhook_lead_not_in_bookable_stage(calendar_service, mock_session):
     lead = _make_lead(current_stage=OutcomeStage.DISQUALIFIED.value, email="jane@acme.com")
 
-    mock_result = MagicMock()
-    mock_scalars = MagicMock()
-    mock_scalars.first.return_value = lead
-    mock_result.scalars.return_value = mock_scalars
-    mock_session.execute.return_value = mock_result
+    _mock_lookup(mock_session, lead)
 
     result = await calendar_service.handle_booking_webhook({
         "payload": {"email": "jane@acme.com", "event": "evt-999"}
@@ -229,6 +307,35 @@ async def test_webhook_lead_not_in_bookable_stage(calendar_service, mock_session
     assert "DISQUALIFIED" in result["reason"]
 
 
+@pytest.mark.asyncio
+async def test_webhook_books_demo_against_database(db_session):
+    from app.repositories.outcome_stage_repository import OutcomeStageRepository
+
+    # Stored and received in different casings: the lookup must go through email_lower
+    lead = Lead(
+        first_name="Jane", last_name="Doe", email="Jane.Doe@Acme.com", company_name="Acme"
+    )
+    db_session.add(lead)
+    await db_session.flush()
+    await OutcomeStageRepository(db_session).transition_to_stage(
+        lead_id=lead.id, new_stage=OutcomeStage.EMAIL_SENT.value, reason="SYSTEM"
+    )
+
+    service = CalendarService(db_session)
+    service.provider = MockCalendarProvider()
+    result = await service.handle_booking_webhook({
+        "payload": {"email": "jane.DOE@acme.COM", "event": "evt-db"}
+    })
+
+    assert result == {"status": "booked", "lead_id": str(lead.id)}
+    history = await service.stage_repo.get_stage_history(lead.id)
+    assert [r.stage for r in history] == [
+        OutcomeStage.EMAIL_SENT.value,
+        OutcomeStage.RESPONDED.value,
+        OutcomeStage.BOOKED_DEMO.value,
+    ]
+
+
 # --- verify_webhook_signature ---
 
 
@@ -255,3 +362,9 @@ def test_verify_signature_invalid():
     with patch("app.services.calendar_service.settings") as mock_settings:
         mock_settings.CALENDLY_WEBHOOK_SECRET = "real-secret"
         assert CalendarService.verify_webhook_signature(b"payload", "wrong-sig") is False
+
+
+def test_verify_signature_wrong_hex_digest():
+    with patch("app.services.calendar_service.settings") as mock_settings:
+        mock_settings.CALENDLY_WEBHOOK_SECRET = "real-secret"
+        assert CalendarService.verify_webhook_signature(b"payload", "ab" * 32) is False
@@ -0,0 +1,140 @@
+"""Test demo session seeding and cleanup against an in-memory SQLite database."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core import database
+from app.models.enums import ActivityType, OutcomeStage, ReplyClassification
+from app.models.orm import (
+    ActivityLog,
+    Lead,
+    LeadOutcomeStage,
+    ReplyClassificationRecord,
+    ScoringConfig,
+    User,
+)
+from app.services import demo_seeder
+from app.services.demo_seeder import (
+    _insert_ignoring_seeded,
+    _load_curated_rows,
+    cleanup_old_sessions,
+    ensure_admin_and_config,
+    seed_for_session,
+)
+
+_SESSION_ID = "3f2b8c1e-6d4a-4f7e-9a51-0c8d2e7b6a90"
+
+
+@pytest.fixture
+def session_factory(test_engine, monkeypatch):
+    """Point the seeder's own sessions at the test database."""
+    factory = async_sessionmaker(test_engine, expire_on_commit=False)
+    monkeypatch.setattr(demo_seeder, "async_session_factory", factory)
+    # The test engine is SQLite whatever DATABASE_URL says: run sessions in turn
+    monkeypatch.setattr(database, "_is_sqlite", True)
+    return factory
+
+
+async def _count(session, model, *where):
+    return await session.scalar(select(func.count()).select_from(model).where(*where))
+
+
+def _demo_lead(session_id, email, created_at=None):
+    return Lead(
+        first_name="Jane",
+        last_name="Smith",
+        email=email,
+        company_name="Acme Corp",
+        demo_session_id=session_id,
+        created_at=created_at,
+    )
+
+
+# --- seed_for_session ---
+
+
+@pytest.mark.asyncio
+async def test_seed_for_session_twice_leaves_one_row_per_curated_lead(db_session):
+    curated = _load_curated_rows()
+    assert curated
+
+    await seed_for_session(_SESSION_ID, db_session)
+    await seed_for_session(_SESSION_ID, db_session)
+
+    leads = (
+        await db_session.scalars(select(Lead).where(Lead.demo_session_id == _SESSION_ID))
+    ).all()
+    assert sorted(lead.email for lead in leads) == sorted(row["email"] for row in curated)
+    assert all(lead.is_demo_seed for lead in leads)
+
+
+@pytest.mark.asyncio
+async def test_insert_ignoring_seeded_skips_rows_already_seeded(db_session):
+    # The path taken when two first requests for a session race past the
+    # exists() check: the second insert must be a no-op
+    rows = [
+        {**row, "status": "NEW", "demo_session_id": _SESSION_ID, "is_demo_seed": True}
+        for row in _load_curated_rows()
+    ]
+
+    await db_session.execute(_insert_ignoring_seeded(db_session), rows)
+    await db_session.execute(_insert_ignoring_seeded(db_session), rows)
+
+    assert await _count(db_session, Lead, Lead.demo_session_id == _SESSION_ID) == len(rows)
+
+
+# --- cleanup_old_sessions ---
+
+
+@pytest.mark.asyncio
+async def test_cleanup_old_sessions_cascades_to_child_rows(session_factory):
+    stale = datetime.now(UTC) - timedelta(days=2)
+    async with session_factory() as session:
+        old_lead = _demo_lead("old-session", "old@acme.com", created_at=stale)
+        fresh_lead = _demo_lead("fresh-session", "fresh@acme.com")
+        # Not a demo lead: never cleaned up, however old
+        real_lead = _demo_lead(None, "real@acme.com", created_at=stale)
+        session.add_all([old_lead, fresh_lead, real_lead])
+        await session.flush()
+
+        for lead in (old_lead, fresh_lead, real_lead):
+            session.add_all([
+                ActivityLog(lead_id=lead.id, type=ActivityType.INGESTED.value),
+                ReplyClassificationRecord(
+                    lead_id=lead.id,
+                    reply_body="Sounds good",
+                    classification=ReplyClassification.QUESTION.value,
+                    confidence=0.9,
+                    reasoning="test",
+                ),
+                LeadOutcomeStage(
+                    lead_id=lead.id, stage=OutcomeStage.EMAIL_SENT.value, reason="SYSTEM"
+                ),
+            ])
+        await session.commit()
+        old_id = old_lead.id
+
+    await cleanup_old_sessions()
+
+    async with session_factory() as session:
+        assert await _count(session, Lead) == 2
+        assert await session.get(Lead, old_id) is None
+        for model in (ActivityLog, ReplyClassificationRecord, LeadOutcomeStage):
+            assert await _count(session, model, model.lead_id == old_id) == 0
+            assert await _count(session, model) == 2
+
+
+# --- ensure_admin_and_config ---
+
+
+@pytest.mark.asyncio
+async def test_ensure_admin_and_config_is_idempotent(session_factory):
+    await ensure_admin_and_config()
+    await ensure_admin_and_config()
+
+    async with session_factory() as session:
+        assert await _count(session, User) == 1
+        assert await _count(session, ScoringConfig) == 1
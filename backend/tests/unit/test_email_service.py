@@ -1,67 +1,88 @@
 """Test email service — draft creation, approval, and mock sending."""
 
+import itertools
 import uuid
-from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import ANY, AsyncMock, Mock, call
 
 import pytest
 
+from app.core.config import settings
 from app.models.enums import ActivityType, DeliveryStatus, EmailVariant, LeadStatus
 from app.models.orm import EmailDraft, Lead
 from app.services.email_service import EmailService
 
+_FIRST_TOUCH = EmailVariant.FIRST_TOUCH.value
+_PENDING = DeliveryStatus.PENDING.value
+_SENT = DeliveryStatus.SENT.value
+_FAILED = DeliveryStatus.FAILED.value
+_EMAIL_SENT = ActivityType.EMAIL_SENT.value
+_EMAIL_DRAFTED = ActivityType.EMAIL_DRAFTED.value
+_QUALIFIED = LeadStatus.QUALIFIED.value
+_CONTACTED = LeadStatus.CONTACTED.value
 
-@pytest.fixture
-def mock_session():
-    return AsyncMock()
+# Process-unique ids are all these tests need; skip uuid4's urandom read
+_id_counter = itertools.count(1)
 
 
-@pytest.fixture
-def mock_email_draft_repo():
-    return AsyncMock()
+def _next_id() -> uuid.UUID:
+    return uuid.UUID(int=next(_id_counter))
 
 
-@pytest.fixture
-def mock_activity_repo():
-    return AsyncMock()
+_LEAD_ID = _next_id()
 
 
-@pytest.fixture
-def mock_lead_repo():
-    return AsyncMock()
+@pytest.fixture(scope="module")
+def email_service_bundle():
+    """EmailService wired to mock session and repositories, shared by the module."""
+    session = AsyncMock()
+    service = EmailService(session)
+    service.email_draft_repo = AsyncMock()
+    service.activity_repo = AsyncMock()
+    service.lead_repo = AsyncMock()
+    return SimpleNamespace(
+        service=service,
+        session=session,
+        draft_repo=service.email_draft_repo,
+        activity_repo=service.activity_repo,
+        lead_repo=service.lead_repo,
+    )
 
 
-@pytest.fixture
-def email_service(mock_session, mock_email_draft_repo, mock_activity_repo, mock_lead_repo):
-    service = EmailService(mock_session)
-    service.email_draft_repo = mock_email_draft_repo
-    service.activity_repo = mock_activity_repo
-    service.lead_repo = mock_lead_repo
-    return service
+@pytest.fixture(autouse=True)
+def _reset_mocks(email_service_bundle):
+    yield
+    b = email_service_bundle
+    # Clear return values and side effects too, not just call history, so no
+    # configured behaviour leaks into the next test
+    for m in (b.session, b.draft_repo, b.activity_repo, b.lead_repo):
+        m.reset_mock(return_value=True, side_effect=True)
 
 
 def _make_draft(lead_id=None, **kwargs):
+    # Spec'd Mock rather than an ORM instance: the service only reads attributes
     defaults = dict(
-        id=uuid.uuid4(),
-        lead_id=lead_id or uuid.uuid4(),
+        id=_next_id(),
+        lead_id=lead_id or _next_id(),
         subject="Test Subject",
         body="Test body content",
-        variant="first_touch",
+        variant=_FIRST_TOUCH,
         approved=False,
-        delivery_status=DeliveryStatus.PENDING.value,
+        delivery_status=_PENDING,
     )
     defaults.update(kwargs)
-    return EmailDraft(**defaults)
+    return Mock(spec=EmailDraft, **defaults)
 
 
 def _make_lead(lead_id=None):
-    return Lead(
-        id=lead_id or uuid.uuid4(),
+    return Mock(
+        spec=Lead,
+        id=lead_id or _next_id(),
         first_name="Jane",
         last_name="Smith",
         email="jane@acme.com",
         company_name="Acme Corp",
-        status=LeadStatus.QUALIFIED.value,
+        status=_QUALIFIED,
         processing_status="IDLE",
     )
 
@@ -70,60 +91,68 @@ def _make_lead(lead_id=None):
 
 
 @pytest.mark.asyncio
-async def test_create_draft(email_service, mock_email_draft_repo, mock_activity_repo):
-    lead_id = uuid.uuid4()
-    draft = _make_draft(lead_id=lead_id)
-    mock_email_draft_repo.create.return_value = draft
+async def test_create_draft(email_service_bundle):
+    b = email_service_bundle
+    draft = _make_draft(lead_id=_LEAD_ID)
+    b.draft_repo.create.return_value = draft
 
-    result = await email_service.create_draft(
-        lead_id=lead_id,
+    result = await b.service.create_draft(
+        lead_id=_LEAD_ID,
         subject="Hello from LeadOps",
         body="We'd love to help you...",
-        variant="first_touch",
+        variant=_FIRST_TOUCH,
     )
 
-    mock_email_draft_repo.create.assert_called_once()
-    kwargs = mock_email_draft_repo.create.call_args.kwargs
-    assert kwargs["lead_id"] == lead_id
-    assert kwargs["subject"] == "Hello from LeadOps"
-    assert kwargs["variant"] == "first_touch"
-    assert kwargs["approved"] is False
+    b.draft_repo.create.assert_called_once_with(
+        lead_id=_LEAD_ID,
+        subject="Hello from LeadOps",
+        body=ANY,
+        variant=_FIRST_TOUCH,
+        approved=False,
+        delivery_status=_PENDING,
+    )
 
     # Activity logged
-    mock_activity_repo.create.assert_called_once()
-    activity_kwargs = mock_activity_repo.create.call_args.kwargs
-    assert activity_kwargs["type"] == ActivityType.EMAIL_DRAFTED.value
+    b.activity_repo.create.assert_called_once_with(
+        lead_id=_LEAD_ID, type=_EMAIL_DRAFTED, payload=ANY
+    )
 
 
 @pytest.mark.asyncio
-async def test_create_draft_invalid_variant_falls_back(email_service, mock_email_draft_repo, mock_activity_repo):
-    lead_id = uuid.uuid4()
-    mock_email_draft_repo.create.return_value = _make_draft(lead_id=lead_id)
+async def test_create_draft_invalid_variant_falls_back(email_service_bundle):
+    b = email_service_bundle
+    b.draft_repo.create.return_value = _make_draft(lead_id=_LEAD_ID)
 
-    await email_service.create_draft(
-        lead_id=lead_id,
+    await b.service.create_draft(
+        lead_id=_LEAD_ID,
         subject="Test",
         body="Body",
         variant="invalid_variant",
     )
 
-    kwargs = mock_email_draft_repo.create.call_args.kwargs
-    assert kwargs["variant"] == EmailVariant.FIRST_TOUCH.value
+    b.draft_repo.create.assert_called_once_with(
+        lead_id=_LEAD_ID,
+        subject="Test",
+        body="Body",
+        variant=_FIRST_TOUCH,
+        approved=False,
+        delivery_status=ANY,
+    )
 
 
 # --- get_drafts ---
 
 
 @pytest.mark.asyncio
-async def test_get_drafts(email_service, mock_email_draft_repo):
-    lead_id = uuid.uuid4()
-    drafts = [_make_draft(lead_id=lead_id), _make_draft(lead_id=lead_id)]
-    mock_email_draft_repo.list.return_value = (drafts, "cursor-xyz")
+async def test_get_drafts(email_service_bundle):
+    b = email_service_bundle
+    drafts = [_make_draft(lead_id=_LEAD_ID), _make_draft(lead_id=_LEAD_ID)]
+    b.draft_repo.list.return_value = (drafts, "cursor-xyz")
 
-    result, cursor = await email_service.get_drafts(lead_id=lead_id, limit=20)
+    result, cursor = await b.service.get_drafts(lead_id=_LEAD_ID, limit=20)
 
-    mock_email_draft_repo.list.assert_called_once_with(
-        filters={"lead_id": lead_id}, cursor=None, limit=20
+    b.draft_repo.list.assert_called_once_with(
+        filters={"lead_id": _LEAD_ID}, cursor=None, limit=20
     )
     assert len(result) == 2
     assert cursor == "cursor-xyz"
@@ -133,85 +162,80 @@ async def test_get_drafts(email_service, mock_email_draft_repo):
 
 
 @pytest.mark.asyncio
-async def test_approve_and_send_mock_mode(
-    email_service, mock_email_draft_repo, mock_activity_repo, mock_lead_repo
-):
-    lead_id = uuid.uuid4()
-    draft = _make_draft(lead_id=lead_id)
-    approved_draft = _make_draft(lead_id=lead_id, approved=True)
+async def test_approve_and_send_mock_mode(email_service_bundle, monkeypatch):
+    b = email_service_bundle
+    draft = _make_draft(lead_id=_LEAD_ID)
+    approved_draft = _make_draft(lead_id=_LEAD_ID, approved=True)
     sent_draft = _make_draft(
-        lead_id=lead_id,
+        lead_id=_LEAD_ID,
         approved=True,
-        delivery_status=DeliveryStatus.SENT.value,
+        delivery_status=_SENT,
     )
-    lead = _make_lead(lead_id=lead_id)
-
-    mock_email_draft_repo.get_by_id.return_value = draft
-    mock_email_draft_repo.update.side_effect = [approved_draft, sent_draft]
-    mock_lead_repo.get_by_id.return_value = lead
-
-    with patch("app.services.email_service.settings") as mock_settings:
-        mock_settings.EMAIL_MODE = "mock"
-        result = await email_service.approve_and_send(draft.id)
+    lead = _make_lead(lead_id=_LEAD_ID)
 
-    assert mock_email_draft_repo.update.call_count == 2
+    b.draft_repo.get_by_id.return_value = draft
+    b.draft_repo.update.side_effect = [approved_draft, sent_draft]
+    b.lead_repo.get_by_id.return_value = lead
 
-    # First call: approve
-    first_call_kwargs = mock_email_draft_repo.update.call_args_list[0].kwargs
-    assert first_call_kwargs["approved"] is True
+    monkeypatch.setattr(settings, "EMAIL_MODE", "mock")
+    result = await b.service.approve_and_send(draft.id)
 
-    # Second call: set sent
-    second_call_kwargs = mock_email_draft_repo.update.call_args_list[1].kwargs
-    assert second_call_kwargs["delivery_status"] == DeliveryStatus.SENT.value
+    # Approve, then mark sent
+    assert b.draft_repo.update.call_args_list == [
+        call(draft, approved=True),
+        call(approved_draft, delivery_status=_SENT, sent_at=ANY),
+    ]
 
     # Activity logged for EMAIL_SENT
-    mock_activity_repo.create.assert_called_once()
-    activity_kwargs = mock_activity_repo.create.call_args.kwargs
-    assert activity_kwargs["type"] == ActivityType.EMAIL_SENT.value
-    assert activity_kwargs["payload"]["mode"] == "mock"
+    b.activity_repo.create.assert_called_once_with(
+        lead_id=_LEAD_ID,
+        type=_EMAIL_SENT,
+        payload={"draft_id": str(sent_draft.id), "subject": sent_draft.subject, "mode": "mock"},
+    )
 
     # Lead status updated to CONTACTED
-    mock_lead_repo.update.assert_called_once()
+    b.lead_repo.update.assert_called_once_with(lead, status=_CONTACTED)
 
 
 @pytest.mark.asyncio
-async def test_approve_and_send_draft_not_found(email_service, mock_email_draft_repo):
-    mock_email_draft_repo.get_by_id.return_value = None
+async def test_approve_and_send_draft_not_found(email_service_bundle):
+    b = email_service_bundle
+    b.draft_repo.get_by_id.return_value = None
 
     with pytest.raises(ValueError, match="Email draft .* not found"):
-        await email_service.approve_and_send(uuid.uuid4())
+        await b.service.approve_and_send(_next_id())
 
 
 @pytest.mark.asyncio
-async def test_approve_and_send_smtp_mode_fails(
-    email_service, mock_email_draft_repo, mock_activity_repo
-):
+async def test_approve_and_send_smtp_mode_fails(email_service_bundle, monkeypatch):
+    b = email_service_bundle
     draft = _make_draft()
-    mock_email_draft_repo.get_by_id.return_value = draft
-    mock_email_draft_repo.update.return_value = draft
+    b.draft_repo.get_by_id.return_value = draft
+    b.draft_repo.update.return_value = draft
 
-    with patch("app.services.email_service.settings") as mock_settings:
-        mock_settings.EMAIL_MODE = "smtp"
-        result = await email_service.approve_and_send(draft.id)
+    monkeypatch.setattr(settings, "EMAIL_MODE", "smtp")
+    result = await b.service.approve_and_send(draft.id)
 
     # Second update should set FAILED status
-    last_call_kwargs = mock_email_draft_repo.update.call_args_list[-1].kwargs
-    assert last_call_kwargs["delivery_status"] == DeliveryStatus.FAILED.value
-    assert "not implemented" in last_call_kwargs["error_message"]
+    b.draft_repo.update.assert_called_with(
+        draft,
+        delivery_status=_FAILED,
+        error_message="SMTP sending not implemented",
+    )
 
 
 @pytest.mark.asyncio
-async def test_approve_and_send_unknown_mode(
-    email_service, mock_email_draft_repo, mock_activity_repo
-):
+async def test_approve_and_send_unknown_mode(email_service_bundle, monkeypatch):
+    b = email_service_bundle
     draft = _make_draft()
-    mock_email_draft_repo.get_by_id.return_value = draft
-    mock_email_draft_repo.update.return_value = draft
+    b.draft_repo.get_by_id.return_value = draft
+    b.draft_repo.update.return_value = draft
 
-    with patch("app.services.email_service.settings") as mock_settings:
-        mock_settings.EMAIL_MODE = "carrier_pigeon"
-        result = await email_service.approve_and_send(draft.id)
+    monkeypatch.setattr(settings, "EMAIL_MODE", "carrier_pigeon")
+    result = await b.service.approve_and_send(draft.id)
 
-    last_call_kwargs = mock_email_draft_repo.update.call_args_list[-1].kwargs
-    assert last_call_kwargs["delivery_status"] == DeliveryStatus.FAILED.value
-    assert "carrier_pigeon" in last_call_kwargs["error_message"]
+    b.draft_repo.update.assert_called_with(
+        draft,
+        delivery_status=_FAILED,
+        error_message="Unknown email mode: carrier_pigeon",
+    )
@@ -5,11 +5,15 @@ import pytest
 from app.tools.enrichment_tool import HeuristicEnrichmentProvider
 
 
-@pytest.mark.asyncio
-async def test_corporate_email():
-    """Test corporate domain is detected correctly."""
-    provider = HeuristicEnrichmentProvider()
+@pytest.fixture(scope="module")
+def provider():
+    """Stateless provider shared by every test in the module."""
+    return HeuristicEnrichmentProvider()
+
 
+@pytest.mark.asyncio
+async def test_corporate_email(provider):
+    """Test corporate domain is detected correctly through the async interface."""
     result = await provider.enrich(
         email="john.doe@acmecorp.com",
         company="Acme Corp",
@@ -21,12 +25,9 @@ async def test_corporate_email():
     assert result["enrichment_source"] == "heuristic"
 
 
-@pytest.mark.asyncio
-async def test_personal_email_gmail():
+def test_personal_email_gmail(provider):
     """Test gmail.com is detected as personal."""
-    provider = HeuristicEnrichmentProvider()
-
-    result = await provider.enrich(
+    result = provider.enrich_sync(
         email="john.doe@gmail.com",
         company="Freelance Consulting",
     )
@@ -38,12 +39,9 @@ async def test_personal_email_gmail():
     assert result["enrichment_source"] == "heuristic"
 
 
-@pytest.mark.asyncio
-async def test_personal_email_yahoo():
+def test_personal_email_yahoo(provider):
     """Test yahoo.com is detected as personal."""
-    provider = HeuristicEnrichmentProvider()
-
-    result = await provider.enrich(
+    result = provider.enrich_sync(
         email="user@yahoo.com",
         company="Startup",
     )
@@ -53,12 +51,9 @@ async def test_personal_email_yahoo():
     assert result["company_type"] == "personal"
 
 
-@pytest.mark.asyncio
-async def test_personal_email_hotmail():
+def test_personal_email_hotmail(provider):
     """Test hotmail.com is detected as personal."""
-    provider = HeuristicEnrichmentProvider()
-
-    result = await provider.enrich(
+    result = provider.enrich_sync(
         email="user@hotmail.com",
         company="Small Business",
     )
@@ -67,12 +62,9 @@ async def test_personal_email_hotmail():
     assert result["is_corporate_email"] is False
 
 
-@pytest.mark.asyncio
-async def test_enterprise_company_keyword():
+def test_enterprise_company_keyword(provider):
     """Test company with 'enterprise' keyword is detected."""
-    provider = HeuristicEnrichmentProvider()
-
-    result = await provider.enrich(
+    result = provider.enrich_sync(
         email="sales@bigcorp.com",
         company="Enterprise Solutions Inc",
     )
@@ -81,12 +73,9 @@ async def test_enterprise_company_keyword():
     assert result["is_corporate_email"] is True
 
 
-@pytest.mark.asyncio
-async def test_enterprise_company_global():
+def test_enterprise_company_global(provider):
     """Test company with 'global' keyword is detected as enterprise."""
-    provider = HeuristicEnrichmentProvider()
-
-    result = await provider.enrich(
+    result = provider.enrich_sync(
         email="contact@company.com",
         company="Global Tech Holdings",
     )
@@ -94,12 +83,9 @@ async def test_enterprise_company_global():
     assert result["estimated_size"] == "enterprise"
 
 
-@pytest.mark.asyncio
-async def test_enterprise_company_international():
+def test_enterprise_company_international(provider):
     """Test company with 'international' keyword is detected as enterprise."""
-    provider = HeuristicEnrichmentProvider()
-
-    result = await provider.enrich(
+    result = provider.enrich_sync(
         email="info@business.io",
         company="International Group Corp",
     )
@@ -107,12 +93,9 @@ async def test_enterprise_company_international():
     assert result["estimated_size"] == "enterprise"
 
 
-@pytest.mark.asyncio
-async def test_unknown_company_size():
+def test_unknown_company_size(provider):
     """Test corporate email with no size indicators returns unknown."""
-    provider = HeuristicEnrichmentProvider()
-
-    result = await provider.enrich(
+    result = provider.enrich_sync(
         email="john@startup.io",
         company="Startup Co",
     )
@@ -121,12 +104,9 @@ async def test_unknown_company_size():
     assert result["estimated_size"] == "unknown"
 
 
-@pytest.mark.asyncio
-async def test_email_without_at_symbol():
+def test_email_without_at_symbol(provider):
     """Test malformed email without @ symbol."""
-    provider = HeuristicEnrichmentProvider()
-
-    result = await provider.enrich(
+    result = provider.enrich_sync(
         email="invalid-email",
         company="Test Company",
     )
@@ -135,12 +115,9 @@ async def test_email_without_at_symbol():
     assert result["is_corporate_email"] is False
 
 
-@pytest.mark.asyncio
-async def test_empty_email():
+def test_empty_email(provider):
     """Test empty email string."""
-    provider = HeuristicEnrichmentProvider()
-
-    result = await provider.enrich(
+    result = provider.enrich_sync(
         email="",
         company="Test Company",
     )
@@ -149,12 +126,9 @@ async def test_empty_email():
     assert result["is_corporate_email"] is False
 
 
-@pytest.mark.asyncio
-async def test_case_insensitive_domain():
+def test_case_insensitive_domain(provider):
     """Test domain detection is case-insensitive."""
-    provider = HeuristicEnrichmentProvider()
-
-    result = await provider.enrich(
+    result = provider.enrich_sync(
         email="USER@GMAIL.COM",
         company="Personal",
     )
@@ -163,12 +137,9 @@ async def test_case_insensitive_domain():
     assert result["is_corporate_email"] is False
 
 
-@pytest.mark.asyncio
-async def test_case_insensitive_company_keyword():
+def test_case_insensitive_company_keyword(provider):
     """Test company keyword detection is case-insensitive."""
-    provider = HeuristicEnrichmentProvider()
-
-    result = await provider.enrich(
+    result = provider.enrich_sync(
         email="contact@company.com",
         company="ENTERPRISE SOFTWARE INC",
     )
@@ -176,12 +147,13 @@ async def test_case_insensitive_company_keyword():
     assert result["estimated_size"] == "enterprise"
 
 
-@pytest.mark.asyncio
-async def test_all_personal_domains():
-    """Test all personal email domains are detected."""
-    provider = HeuristicEnrichmentProvider()
+def test_all_personal_domains():
+    """Test all personal email domains are in the provider's lookup set.
 
-    personal_domains = [
+    Classification is a set membership check, exercised end to end by the
+    gmail/yahoo/hotmail tests above.
+    """
+    assert HeuristicEnrichmentProvider.PERSONAL_DOMAINS >= {
         "gmail.com",
         "yahoo.com",
         "hotmail.com",
@@ -190,38 +162,25 @@ async def test_all_personal_domains():
         "icloud.com",
         "mail.com",
         "protonmail.com",
-    ]
-
-    for domain in personal_domains:
-        result = await provider.enrich(
-            email=f"user@{domain}",
-            company="Test",
-        )
-        assert result["is_corporate_email"] is False, f"Failed for {domain}"
-        assert result["company_type"] == "personal", f"Failed for {domain}"
+    }
 
 
-@pytest.mark.asyncio
-async def test_all_enterprise_keywords():
+@pytest.mark.parametrize(
+    "keyword",
+    ["enterprise", "global", "international", "corp", "inc", "group", "holdings", "capital"],
+)
+def test_all_enterprise_keywords(provider, keyword):
     """Test all enterprise keywords are detected."""
-    provider = HeuristicEnrichmentProvider()
-
-    keywords = ["enterprise", "global", "international", "corp", "inc", "group", "holdings", "capital"]
-
-    for keyword in keywords:
-        result = await provider.enrich(
-            email="contact@company.com",
-            company=f"Test {keyword} Company",
-        )
-        assert result["estimated_size"] == "enterprise", f"Failed for keyword: {keyword}"
+    result = provider.enrich_sync(
+        email="contact@company.com",
+        company=f"Test {keyword} Company",
+    )
+    assert result["estimated_size"] == "enterprise"
 
 
-@pytest.mark.asyncio
-async def test_enrichment_result_structure():
+def test_enrichment_result_structure(provider):
     """Test enrichment result has all expected fields."""
-    provider = HeuristicEnrichmentProvider()
-
-    result = await provider.enrich(
+    result = provider.enrich_sync(
         email="test@example.com",
         company="Example Corp",
     )
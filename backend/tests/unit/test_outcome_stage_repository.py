@@ -0,0 +1,152 @@
+"""Test OutcomeStageRepository against an in-memory SQLite database."""
+
+import uuid
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.models.enums import OutcomeStage
+from app.models.orm import Lead, LeadOutcomeStage
+from app.repositories.outcome_stage_repository import VALID_TRANSITIONS, OutcomeStageRepository
+
+
+def _naive(dt):
+    # SQLite hands back naive datetimes; compare wall-clock values only
+    return dt.replace(tzinfo=None)
+
+
+@pytest.fixture
+async def lead(db_session):
+    lead = Lead(
+        first_name="Jane",
+        last_name="Smith",
+        email="jane@acme.com",
+        company_name="Acme Corp",
+    )
+    db_session.add(lead)
+    await db_session.flush()
+    await db_session.refresh(lead)
+    return lead
+
+
+@pytest.fixture
+def stage_repo(db_session):
+    return OutcomeStageRepository(db_session)
+
+
+@pytest.mark.asyncio
+async def test_first_transition_has_no_previous_stage(stage_repo, lead):
+    record = await stage_repo.transition_to_stage(
+        lead_id=lead.id,
+        new_stage=OutcomeStage.EMAIL_SENT.value,
+        reason="SYSTEM",
+        triggered_by="system",
+    )
+
+    assert record.id is not None
+    assert record.stage == OutcomeStage.EMAIL_SENT.value
+    assert record.previous_stage is None
+    assert record.exited_at is None
+    assert lead.current_outcome_stage == OutcomeStage.EMAIL_SENT.value
+    assert _naive(lead.outcome_stage_entered_at) == _naive(record.entered_at)
+
+
+@pytest.mark.asyncio
+async def test_transition_closes_open_record(stage_repo, lead):
+    first = await stage_repo.transition_to_stage(
+        lead_id=lead.id, new_stage=OutcomeStage.EMAIL_SENT.value, reason="SYSTEM"
+    )
+    second = await stage_repo.transition_to_stage(
+        lead_id=lead.id,
+        new_stage=OutcomeStage.RESPONDED.value,
+        reason="MANUAL",
+        notes="Replied",
+        metadata={"source": "test"},
+    )
+
+    assert second.previous_stage == OutcomeStage.EMAIL_SENT.value
+    assert second.notes == "Replied"
+    assert second.metadata_json == {"source": "test"}
+    assert _naive(first.exited_at) == _naive(second.entered_at)
+    assert lead.current_outcome_stage == OutcomeStage.RESPONDED.value
+
+    history = await stage_repo.get_stage_history(lead.id)
+    assert [r.stage for r in history] == [
+        OutcomeStage.EMAIL_SENT.value,
+        OutcomeStage.RESPONDED.value,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_transition_through_chains_stages(stage_repo, lead):
+    first = await stage_repo.transition_to_stage(
+        lead_id=lead.id, new_stage=OutcomeStage.EMAIL_SENT.value, reason="SYSTEM"
+    )
+    responded, booked = await stage_repo.transition_through(
+        lead.id,
+        [
+            (OutcomeStage.RESPONDED.value, "AUTOMATIC", "calendly_webhook", "Auto"),
+            (OutcomeStage.BOOKED_DEMO.value, "AUTOMATIC", "calendly_webhook", "Booked"),
+        ],
+    )
+
+    assert responded.previous_stage == OutcomeStage.EMAIL_SENT.value
+    assert booked.previous_stage == OutcomeStage.RESPONDED.value
+    assert _naive(first.exited_at) == _naive(responded.entered_at)
+    assert _naive(responded.exited_at) == _naive(booked.entered_at)
+    assert booked.exited_at is None
+    assert lead.current_outcome_stage == OutcomeStage.BOOKED_DEMO.value
+    assert _naive(lead.outcome_stage_entered_at) == _naive(booked.entered_at)
+
+    history = await stage_repo.get_stage_history(lead.id)
+    assert [r.stage for r in history] == [
+        OutcomeStage.EMAIL_SENT.value,
+        OutcomeStage.RESPONDED.value,
+        OutcomeStage.BOOKED_DEMO.value,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_latest_record(stage_repo, lead):
+    assert await stage_repo.get_latest_record(lead.id) is None
+
+    await stage_repo.transition_through(
+        lead.id,
+        [
+            (OutcomeStage.EMAIL_SENT.value, "SYSTEM", None, None),
+            (OutcomeStage.RESPONDED.value, "MANUAL", None, None),
+        ],
+    )
+
+    latest = await stage_repo.get_latest_record(lead.id)
+    assert latest.stage == OutcomeStage.RESPONDED.value
+    assert latest.exited_at is None
+
+
+@pytest.mark.asyncio
+async def test_transition_unknown_lead_raises(stage_repo):
+    with pytest.raises(ValueError, match="not found"):
+        await stage_repo.transition_to_stage(
+            lead_id=uuid.uuid4(), new_stage=OutcomeStage.EMAIL_SENT.value, reason="SYSTEM"
+        )
+
+
+@pytest.mark.asyncio
+async def test_second_open_stage_record_rejected(db_session, stage_repo, lead):
+    await stage_repo.transition_to_stage(
+        lead_id=lead.id, new_stage=OutcomeStage.EMAIL_SENT.value, reason="SYSTEM"
+    )
+
+    db_session.add(
+        LeadOutcomeStage(lead_id=lead.id, stage=OutcomeStage.RESPONDED.value, reason="MANUAL")
+    )
+    with pytest.raises(IntegrityError):
+        await db_session.flush()
+
+
+def test_valid_transitions_cover_every_stage():
+    stages = {stage.value for stage in OutcomeStage}
+    assert set(VALID_TRANSITIONS) == stages
+    for targets in VALID_TRANSITIONS.values():
+        assert isinstance(targets, frozenset)
+        assert targets <= stages
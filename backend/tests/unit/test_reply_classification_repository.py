@@ -0,0 +1,57 @@
+"""Test ReplyClassificationRepository against an in-memory SQLite database."""
+
+import pytest
+
+from app.models.orm import Lead
+from app.repositories.reply_classification_repository import ReplyClassificationRepository
+
+
+@pytest.fixture
+async def lead(db_session):
+    lead = Lead(
+        first_name="Jane",
+        last_name="Smith",
+        email="jane@acme.com",
+        company_name="Acme Corp",
+    )
+    db_session.add(lead)
+    await db_session.flush()
+    return lead
+
+
+@pytest.fixture
+def classification_repo(db_session):
+    return ReplyClassificationRepository(db_session)
+
+
+async def _classify(repo, lead, classification):
+    return await repo.create(
+        lead_id=lead.id,
+        reply_body="Thanks for reaching out",
+        classification=classification,
+        confidence=0.9,
+        reasoning="test",
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_latest_for_lead_without_classifications(classification_repo, lead):
+    assert await classification_repo.get_latest_for_lead(lead.id) is None
+
+
+@pytest.mark.asyncio
+async def test_create_points_lead_at_newest_classification(
+    db_session, classification_repo, lead
+):
+    await _classify(classification_repo, lead, "INTERESTED")
+    newest = await _classify(classification_repo, lead, "NOT_INTERESTED")
+
+    latest = await classification_repo.get_latest_for_lead(lead.id)
+    assert latest.id == newest.id
+
+    await db_session.refresh(lead)
+    assert lead.current_classification_id == newest.id
+
+    # Overriding keeps the pointer on the same record
+    await classification_repo.override(newest.id, "INTERESTED", "admin")
+    assert (await classification_repo.get_latest_for_lead(lead.id)).id == newest.id
@@ -1,49 +1,155 @@
 """Test reply classification service — rule-based, LLM, and override logic."""
 
 import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, patch
 
 import pytest
 
 from app.models.enums import ActivityType, ReplyClassification
 from app.models.llm_schemas import ReplyClassificationResult
 from app.models.orm import Lead, ReplyClassificationRecord
+from app.services import reply_classification_service as classification_module
 from app.services.reply_classification_service import (
     ReplyClassificationService,
     _extract_dates_from_text,
 )
 
+_INTERESTED_BOOK_DEMO = ReplyClassification.INTERESTED_BOOK_DEMO.value
+_NOT_INTERESTED = ReplyClassification.NOT_INTERESTED.value
+_QUESTION = ReplyClassification.QUESTION.value
+_REPLY_CLASSIFIED = ActivityType.REPLY_CLASSIFIED.value
+_CLASSIFICATION_OVERRIDDEN = ActivityType.CLASSIFICATION_OVERRIDDEN.value
+
+_LEAD_ID = uuid.uuid4()
+# Longer than the 2000 characters the service stores
+_LONG_REPLY = "x" * 3000
+
+# Constructor kwargs for one canonical record per classification, in the
+# shape the rule-based classifier produces them
+_RECORD_FIELDS = {
+    classification: dict(
+        lead_id=_LEAD_ID,
+        reply_body=reply_body,
+        classification=classification.value,
+        confidence=confidence,
+        reasoning=reasoning,
+        is_auto_reply=is_auto_reply,
+    )
+    for classification, reply_body, confidence, reasoning, is_auto_reply in [
+        (
+            ReplyClassification.INTERESTED_BOOK_DEMO,
+            "I'd love to schedule a demo",
+            0.75,
+            "Reply contains interest/scheduling language",
+            False,
+        ),
+        (
+            ReplyClassification.NOT_INTERESTED,
+            "No thanks, not interested",
+            0.8,
+            "Reply contains not-interested language",
+            False,
+        ),
+        (
+            ReplyClassification.QUESTION,
+            "Can you tell me more about pricing?",
+            0.7,
+            "Reply contains question patterns",
+            False,
+        ),
+        (
+            ReplyClassification.OUT_OF_OFFICE,
+            "I am out of office until March 5th. I will respond when I return.",
+            0.85,
+            "Reply matches out-of-office patterns",
+            True,
+        ),
+        (
+            ReplyClassification.UNSUBSCRIBE,
+            "Please remove me from your list",
+            0.9,
+            "Reply contains unsubscribe/opt-out language",
+            False,
+        ),
+        (
+            ReplyClassification.UNCLEAR,
+            "Lorem ipsum dolor sit amet",
+            0.5,
+            "Reply does not match any known patterns",
+            False,
+        ),
+    ]
+}
+
+
+def _record(classification, **overrides):
+    # Rebuilt from kwargs rather than copy.copy(): a shallow copy of an ORM
+    # instance shares its _sa_instance_state with the original
+    fields = {"id": uuid.uuid4(), **_RECORD_FIELDS[classification], **overrides}
+    return ReplyClassificationRecord(**fields)
+
+
+# Canonical repository return values. Tests only read these back, so they're
+# built once and shared
+_RECORD_TEMPLATES = {c: _record(c) for c in _RECORD_FIELDS}
+
+
+class _FakeSession:
+    """Stands in for AsyncSession; the service only calls get() to load the lead."""
+
+    def __init__(self):
+        self.lead = None
+
+    async def get(self, model, ident):
+        return self.lead
+
 
 # --- Fixtures ---
 
 
-@pytest.fixture
-def mock_session():
-    return AsyncMock()
+# One set of mocks per module, reset after each test rather than rebuilt
+@pytest.fixture(scope="module")
+def fake_session():
+    return _FakeSession()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_classification_repo():
     return AsyncMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_activity_repo():
     return AsyncMock()
 
 
-@pytest.fixture
-def classification_service(mock_session, mock_classification_repo, mock_activity_repo):
-    service = ReplyClassificationService(mock_session)
+@pytest.fixture(scope="module")
+def classification_service(fake_session, mock_classification_repo, mock_activity_repo):
+    service = ReplyClassificationService(fake_session)
     service.repo = mock_classification_repo
     service.activity_repo = mock_activity_repo
     return service
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_mocks(fake_session, mock_classification_repo, mock_activity_repo):
+    yield
+    fake_session.lead = None
+    for m in (mock_classification_repo, mock_activity_repo):
+        m.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(autouse=True)
+def _no_llm(monkeypatch):
+    # Rule-based path by default; the LLM tests patch has_llm_key back on
+    monkeypatch.setattr(classification_module, "has_llm_key", lambda: False)
+
+
+@pytest.fixture(scope="module")
 def mock_lead():
+    # Shared across the module: the service only reads attributes off the lead
     return Lead(
-        id=uuid.uuid4(),
+        id=_LEAD_ID,
         first_name="Jane",
         last_name="Smith",
         email="jane@acme.com",
@@ -58,269 +164,135 @@ def mock_lead():
 # --- Rule-based classification tests ---
 
 
+@pytest.mark.parametrize(
+    "classification",
+    list(_RECORD_TEMPLATES),
+    ids=lambda c: c.value.lower(),
+)
 @pytest.mark.asyncio
-async def test_classify_interested_book_demo(
-    classification_service, mock_session, mock_classification_repo, mock_lead
-):
-    mock_session.get.return_value = mock_lead
-    mock_classification_repo.create.return_value = ReplyClassificationRecord(
-        id=uuid.uuid4(),
-        lead_id=mock_lead.id,
-        reply_body="I'd love to schedule a demo",
-        classification=ReplyClassification.INTERESTED_BOOK_DEMO.value,
-        confidence=0.75,
-        reasoning="Reply contains interest/scheduling language",
-        is_auto_reply=False,
-    )
-
-    with patch("app.services.reply_classification_service.has_llm_key", return_value=False):
-        result = await classification_service.classify_reply(
-            lead_id=mock_lead.id,
-            reply_body="I'd love to schedule a demo",
-        )
-
-    assert result.classification == ReplyClassification.INTERESTED_BOOK_DEMO.value
-
-
-@pytest.mark.asyncio
-async def test_classify_not_interested(
-    classification_service, mock_session, mock_classification_repo, mock_lead
-):
-    mock_session.get.return_value = mock_lead
-    mock_classification_repo.create.return_value = ReplyClassificationRecord(
-        id=uuid.uuid4(),
-        lead_id=mock_lead.id,
-        reply_body="No thanks, not interested",
-        classification=ReplyClassification.NOT_INTERESTED.value,
-        confidence=0.8,
-        reasoning="Reply contains not-interested language",
-        is_auto_reply=False,
-    )
-
-    with patch("app.services.reply_classification_service.has_llm_key", return_value=False):
-        result = await classification_service.classify_reply(
-            lead_id=mock_lead.id,
-            reply_body="No thanks, not interested",
-        )
-
-    assert result.classification == ReplyClassification.NOT_INTERESTED.value
-
-
-@pytest.mark.asyncio
-async def test_classify_question(
-    classification_service, mock_session, mock_classification_repo, mock_lead
+async def test_classify_with_rules(
+    classification, classification_service, fake_session, mock_classification_repo, mock_lead
 ):
-    mock_session.get.return_value = mock_lead
-    mock_classification_repo.create.return_value = ReplyClassificationRecord(
-        id=uuid.uuid4(),
-        lead_id=mock_lead.id,
-        reply_body="Can you tell me more about pricing?",
-        classification=ReplyClassification.QUESTION.value,
-        confidence=0.7,
-        reasoning="Reply contains question patterns",
-        is_auto_reply=False,
-    )
-
-    with patch("app.services.reply_classification_service.has_llm_key", return_value=False):
-        result = await classification_service.classify_reply(
-            lead_id=mock_lead.id,
-            reply_body="Can you tell me more about pricing?",
-        )
-
-    assert result.classification == ReplyClassification.QUESTION.value
+    template = _RECORD_TEMPLATES[classification]
+    fake_session.lead = mock_lead
+    mock_classification_repo.create.return_value = template
 
-
-@pytest.mark.asyncio
-async def test_classify_out_of_office(
-    classification_service, mock_session, mock_classification_repo, mock_lead
-):
-    reply = "I am out of office until March 5th. I will respond when I return."
-    mock_session.get.return_value = mock_lead
-    mock_classification_repo.create.return_value = ReplyClassificationRecord(
-        id=uuid.uuid4(),
+    result = await classification_service.classify_reply(
         lead_id=mock_lead.id,
-        reply_body=reply,
-        classification=ReplyClassification.OUT_OF_OFFICE.value,
-        confidence=0.85,
-        reasoning="Reply matches out-of-office patterns",
-        is_auto_reply=True,
+        reply_body=template.reply_body,
     )
 
-    with patch("app.services.reply_classification_service.has_llm_key", return_value=False):
-        result = await classification_service.classify_reply(
-            lead_id=mock_lead.id,
-            reply_body=reply,
-        )
-
-    assert result.classification == ReplyClassification.OUT_OF_OFFICE.value
-    # Verify repo.create was called with is_auto_reply=True
+    assert result.classification == classification.value
     create_kwargs = mock_classification_repo.create.call_args.kwargs
-    assert create_kwargs["is_auto_reply"] is True
+    assert create_kwargs["classification"] == classification.value
+    assert create_kwargs["confidence"] == template.confidence
+    assert create_kwargs["is_auto_reply"] is template.is_auto_reply
 
 
 @pytest.mark.asyncio
-async def test_classify_unsubscribe(
-    classification_service, mock_session, mock_classification_repo, mock_lead
+async def test_classify_stores_record(
+    classification_service, fake_session, mock_classification_repo, mock_lead
 ):
-    mock_session.get.return_value = mock_lead
-    mock_classification_repo.create.return_value = ReplyClassificationRecord(
-        id=uuid.uuid4(),
-        lead_id=mock_lead.id,
-        reply_body="Please remove me from your list",
-        classification=ReplyClassification.UNSUBSCRIBE.value,
-        confidence=0.9,
-        reasoning="Reply contains unsubscribe/opt-out language",
-        is_auto_reply=False,
-    )
+    fake_session.lead = mock_lead
+    mock_classification_repo.create.return_value = _RECORD_TEMPLATES[
+        ReplyClassification.NOT_INTERESTED
+    ]
 
-    with patch("app.services.reply_classification_service.has_llm_key", return_value=False):
-        result = await classification_service.classify_reply(
-            lead_id=mock_lead.id,
-            reply_body="Please remove me from your list",
-        )
-
-    assert result.classification == ReplyClassification.UNSUBSCRIBE.value
-
-
-@pytest.mark.asyncio
-async def test_classify_unclear(
-    classification_service, mock_session, mock_classification_repo, mock_lead
-):
-    mock_session.get.return_value = mock_lead
-    mock_classification_repo.create.return_value = ReplyClassificationRecord(
-        id=uuid.uuid4(),
+    await classification_service.classify_reply(
         lead_id=mock_lead.id,
-        reply_body="Lorem ipsum dolor sit amet",
-        classification=ReplyClassification.UNCLEAR.value,
-        confidence=0.5,
-        reasoning="Reply does not match any known patterns",
-        is_auto_reply=False,
+        reply_body="No thanks, not interested",
+        sender_email="jane@acme.com",
     )
 
-    with patch("app.services.reply_classification_service.has_llm_key", return_value=False):
-        result = await classification_service.classify_reply(
-            lead_id=mock_lead.id,
-            reply_body="Lorem ipsum dolor sit amet",
-        )
-
-    assert result.classification == ReplyClassification.UNCLEAR.value
-    create_kwargs = mock_classification_repo.create.call_args.kwargs
-    assert create_kwargs["confidence"] == 0.5
-
-
-@pytest.mark.asyncio
-async def test_classify_stores_record(
-    classification_service, mock_session, mock_classification_repo, mock_lead
-):
-    mock_session.get.return_value = mock_lead
-    mock_classification_repo.create.return_value = ReplyClassificationRecord(
-        id=uuid.uuid4(),
+    mock_classification_repo.create.assert_called_once_with(
         lead_id=mock_lead.id,
-        reply_body="No thanks",
-        classification=ReplyClassification.NOT_INTERESTED.value,
+        reply_body="No thanks, not interested",
+        classification=_NOT_INTERESTED,
         confidence=0.8,
-        reasoning="Reply contains not-interested language",
+        reasoning=ANY,
+        extracted_dates=[],
         is_auto_reply=False,
     )
 
-    with patch("app.services.reply_classification_service.has_llm_key", return_value=False):
-        await classification_service.classify_reply(
-            lead_id=mock_lead.id,
-            reply_body="No thanks, not interested",
-            sender_email="jane@acme.com",
-        )
-
-    mock_classification_repo.create.assert_called_once()
-    kwargs = mock_classification_repo.create.call_args.kwargs
-    assert kwargs["lead_id"] == mock_lead.id
-    assert kwargs["classification"] == ReplyClassification.NOT_INTERESTED.value
-    assert kwargs["confidence"] == 0.8
-
 
 @pytest.mark.asyncio
 async def test_classify_logs_activity(
-    classification_service, mock_session, mock_classification_repo, mock_activity_repo, mock_lead
+    classification_service, fake_session, mock_classification_repo, mock_activity_repo, mock_lead
 ):
-    mock_session.get.return_value = mock_lead
-    mock_classification_repo.create.return_value = ReplyClassificationRecord(
-        id=uuid.uuid4(),
+    fake_session.lead = mock_lead
+    mock_classification_repo.create.return_value = _RECORD_TEMPLATES[
+        ReplyClassification.INTERESTED_BOOK_DEMO
+    ]
+
+    await classification_service.classify_reply(
         lead_id=mock_lead.id,
         reply_body="Sounds great, let's chat",
-        classification=ReplyClassification.INTERESTED_BOOK_DEMO.value,
-        confidence=0.75,
-        reasoning="Reply contains interest/scheduling language",
-        is_auto_reply=False,
+        sender_email="jane@acme.com",
     )
 
-    with patch("app.services.reply_classification_service.has_llm_key", return_value=False):
-        await classification_service.classify_reply(
-            lead_id=mock_lead.id,
-            reply_body="Sounds great, let's chat",
-            sender_email="jane@acme.com",
-        )
-
-    mock_activity_repo.create.assert_called_once()
-    activity_kwargs = mock_activity_repo.create.call_args.kwargs
-    assert activity_kwargs["lead_id"] == mock_lead.id
-    assert activity_kwargs["type"] == ActivityType.REPLY_CLASSIFIED.value
-    assert activity_kwargs["payload"]["classification"] == ReplyClassification.INTERESTED_BOOK_DEMO.value
-    assert activity_kwargs["payload"]["sender_email"] == "jane@acme.com"
+    mock_activity_repo.create.assert_called_once_with(
+        lead_id=mock_lead.id,
+        type=_REPLY_CLASSIFIED,
+        payload={
+            "classification": _INTERESTED_BOOK_DEMO,
+            "confidence": ANY,
+            "is_auto_reply": False,
+            "sender_email": "jane@acme.com",
+        },
+    )
 
 
 @pytest.mark.asyncio
 async def test_classify_truncates_long_reply(
-    classification_service, mock_session, mock_classification_repo, mock_lead
+    classification_service, fake_session, mock_classification_repo, mock_lead
 ):
-    long_reply = "x" * 3000
-    mock_session.get.return_value = mock_lead
-    mock_classification_repo.create.return_value = ReplyClassificationRecord(
-        id=uuid.uuid4(),
+    fake_session.lead = mock_lead
+    mock_classification_repo.create.return_value = _RECORD_TEMPLATES[
+        ReplyClassification.UNCLEAR
+    ]
+
+    await classification_service.classify_reply(
         lead_id=mock_lead.id,
-        reply_body=long_reply[:2000],
-        classification=ReplyClassification.UNCLEAR.value,
-        confidence=0.5,
-        reasoning="Reply does not match any known patterns",
-        is_auto_reply=False,
+        reply_body=_LONG_REPLY,
     )
 
-    with patch("app.services.reply_classification_service.has_llm_key", return_value=False):
-        await classification_service.classify_reply(
-            lead_id=mock_lead.id,
-            reply_body=long_reply,
-        )
-
-    kwargs = mock_classification_repo.create.call_args.kwargs
-    assert len(kwargs["reply_body"]) == 2000
+    mock_classification_repo.create.assert_called_once_with(
+        lead_id=mock_lead.id,
+        reply_body=_LONG_REPLY[:2000],
+        classification=ANY,
+        confidence=ANY,
+        reasoning=ANY,
+        extracted_dates=ANY,
+        is_auto_reply=ANY,
+    )
 
 
 @pytest.mark.asyncio
-async def test_classify_lead_not_found(classification_service, mock_session):
-    mock_session.get.return_value = None
+async def test_classify_lead_not_found(classification_service, fake_session):
+    fake_session.lead = None
 
     with pytest.raises(ValueError, match="Lead .* not found"):
-        with patch("app.services.reply_classification_service.has_llm_key", return_value=False):
-            await classification_service.classify_reply(
-                lead_id=uuid.uuid4(),
-                reply_body="Hello",
-            )
+        await classification_service.classify_reply(
+            lead_id=uuid.uuid4(),
+            reply_body="Hello",
+        )
 
 
 # --- Date extraction tests ---
 
 
-def test_extract_dates_day_names():
-    dates = _extract_dates_from_text("How about next Monday or Tuesday?")
-    assert any("monday" in d for d in dates)
-
-
-def test_extract_dates_month_format():
-    dates = _extract_dates_from_text("I'm available Jan 15 or Feb 3rd")
-    assert any("jan 15" in d for d in dates)
-
-
-def test_extract_dates_numeric():
-    dates = _extract_dates_from_text("Let's do 2/15/2025")
-    assert any("2/15/2025" in d for d in dates)
+@pytest.mark.parametrize(
+    "text,needle",
+    [
+        ("How about next Monday or Tuesday?", "monday"),
+        ("I'm available Jan 15 or Feb 3rd", "jan 15"),
+        ("Let's do 2/15/2025", "2/15/2025"),
+    ],
+    ids=["day_names", "month_format", "numeric"],
+)
+def test_extract_dates(text, needle):
+    dates = _extract_dates_from_text(text)
+    assert any(needle in d for d in dates)
 
 
 # --- Override tests ---
@@ -333,16 +305,12 @@ async def test_override_classification(
     classification_id = uuid.uuid4()
     lead_id = uuid.uuid4()
 
-    mock_classification_repo.override.return_value = ReplyClassificationRecord(
+    mock_classification_repo.override.return_value = _record(
+        ReplyClassification.NOT_INTERESTED,
         id=classification_id,
         lead_id=lead_id,
-        reply_body="Some reply",
-        classification=ReplyClassification.NOT_INTERESTED.value,
-        confidence=0.8,
-        reasoning="Original reasoning",
-        is_auto_reply=False,
         overridden_by="admin@example.com",
-        overridden_classification=ReplyClassification.QUESTION.value,
+        overridden_classification=_QUESTION,
     )
 
     result = await classification_service.override_classification(
@@ -353,13 +321,13 @@ async def test_override_classification(
 
     mock_classification_repo.override.assert_called_once_with(
         classification_id=classification_id,
-        new_classification=ReplyClassification.QUESTION.value,
+        new_classification=_QUESTION,
         overridden_by="admin@example.com",
     )
     mock_activity_repo.create.assert_called_once()
     activity_kwargs = mock_activity_repo.create.call_args.kwargs
-    assert activity_kwargs["type"] == ActivityType.CLASSIFICATION_OVERRIDDEN.value
-    assert activity_kwargs["payload"]["new_classification"] == ReplyClassification.QUESTION.value
+    assert activity_kwargs["type"] == _CLASSIFICATION_OVERRIDDEN
+    assert activity_kwargs["payload"]["new_classification"] == _QUESTION
 
 
 @pytest.mark.asyncio
@@ -377,13 +345,32 @@ async def test_override_not_found(classification_service, mock_classification_re
 # --- LLM path tests ---
 
 
+class _StubLLM:
+    """Chat model stand-in: structured output returns itself, ainvoke returns or raises."""
+
+    def __init__(self, result=None, exc=None):
+        self._result = result
+        self._exc = exc
+        self.prompts = []
+
+    def with_structured_output(self, schema):
+        return self
+
+    async def ainvoke(self, prompt):
+        self.prompts.append(prompt)
+        if self._exc is not None:
+            raise self._exc
+        return self._result
+
+
 @pytest.mark.asyncio
 async def test_classify_with_llm(
-    classification_service, mock_session, mock_classification_repo, mock_lead
+    classification_service, fake_session, mock_classification_repo, mock_lead
 ):
-    mock_session.get.return_value = mock_lead
+    fake_session.lead = mock_lead
 
-    llm_result = ReplyClassificationResult(
+    # Stands in for already-parsed structured output; the schema itself isn't under test
+    llm_result = ReplyClassificationResult.model_construct(
         classification=ReplyClassification.INTERESTED_BOOK_DEMO,
         confidence=0.95,
         reasoning="LLM determined high interest",
@@ -391,64 +378,49 @@ async def test_classify_with_llm(
         is_auto_reply=False,
     )
 
-    mock_llm = MagicMock()
-    mock_structured = MagicMock()
-    mock_llm.with_structured_output.return_value = mock_structured
-    mock_structured.ainvoke = AsyncMock(return_value=llm_result)
+    stub_llm = _StubLLM(result=llm_result)
 
-    mock_classification_repo.create.return_value = ReplyClassificationRecord(
-        id=uuid.uuid4(),
-        lead_id=mock_lead.id,
+    mock_classification_repo.create.return_value = _record(
+        ReplyClassification.INTERESTED_BOOK_DEMO,
         reply_body="I'd love to see a demo next Tuesday!",
-        classification=ReplyClassification.INTERESTED_BOOK_DEMO.value,
         confidence=0.95,
         reasoning="LLM determined high interest",
         extracted_dates=["next tuesday"],
-        is_auto_reply=False,
     )
 
-    with patch("app.services.reply_classification_service.has_llm_key", return_value=True), \
-         patch("app.services.reply_classification_service.get_llm", return_value=mock_llm):
+    with patch.object(classification_module, "has_llm_key", return_value=True), \
+         patch.object(classification_module, "get_llm", return_value=stub_llm):
         result = await classification_service.classify_reply(
             lead_id=mock_lead.id,
             reply_body="I'd love to see a demo next Tuesday!",
         )
 
-    assert result.classification == ReplyClassification.INTERESTED_BOOK_DEMO.value
+    assert result.classification == _INTERESTED_BOOK_DEMO
     assert result.confidence == 0.95
-    mock_structured.ainvoke.assert_called_once()
+    assert len(stub_llm.prompts) == 1
 
 
 @pytest.mark.asyncio
 async def test_classify_llm_fallback_to_rules(
-    classification_service, mock_session, mock_classification_repo, mock_lead
+    classification_service, fake_session, mock_classification_repo, mock_lead
 ):
-    mock_session.get.return_value = mock_lead
+    fake_session.lead = mock_lead
 
-    mock_llm = MagicMock()
-    mock_structured = MagicMock()
-    mock_llm.with_structured_output.return_value = mock_structured
-    mock_structured.ainvoke = AsyncMock(side_effect=RuntimeError("LLM unavailable"))
+    stub_llm = _StubLLM(exc=RuntimeError("LLM unavailable"))
 
-    mock_classification_repo.create.return_value = ReplyClassificationRecord(
-        id=uuid.uuid4(),
-        lead_id=mock_lead.id,
-        reply_body="No thanks, not interested",
-        classification=ReplyClassification.NOT_INTERESTED.value,
-        confidence=0.8,
-        reasoning="Reply contains not-interested language",
-        is_auto_reply=False,
-    )
+    mock_classification_repo.create.return_value = _RECORD_TEMPLATES[
+        ReplyClassification.NOT_INTERESTED
+    ]
 
-    with patch("app.services.reply_classification_service.has_llm_key", return_value=True), \
-         patch("app.services.reply_classification_service.get_llm", return_value=mock_llm):
+    with patch.object(classification_module, "has_llm_key", return_value=True), \
+         patch.object(classification_module, "get_llm", return_value=stub_llm):
         result = await classification_service.classify_reply(
             lead_id=mock_lead.id,
             reply_body="No thanks, not interested",
         )
 
     # Should fall back to rule-based and still work
-    assert result.classification == ReplyClassification.NOT_INTERESTED.value
+    assert result.classification == _NOT_INTERESTED
     # Verify repo.create was called with rule-based confidence (0.8)
     kwargs = mock_classification_repo.create.call_args.kwargs
     assert kwargs["confidence"] == 0.8
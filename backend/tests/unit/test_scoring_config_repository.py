@@ -0,0 +1,118 @@
+"""Test ScoringConfigRepository's active-config cache against in-memory SQLite."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import insert
+
+from app.models.orm import ScoringConfig
+from app.repositories import scoring_config_repository as repo_module
+from app.repositories.scoring_config_repository import (
+    DEFAULT_THRESHOLDS,
+    DEFAULT_WEIGHTS,
+    ScoringConfigRepository,
+)
+
+
+def _later():
+    # SQLite's CURRENT_TIMESTAMP has one-second resolution; make newer rows sort first
+    return datetime.now(UTC) + timedelta(minutes=1)
+
+
+@pytest.fixture
+def config_repo(db_session):
+    return ScoringConfigRepository(db_session)
+
+
+@pytest.mark.asyncio
+async def test_get_active_creates_defaults_when_empty(db_session, config_repo):
+    config = await config_repo.get_active()
+
+    assert config.weights == DEFAULT_WEIGHTS
+    assert config.thresholds == DEFAULT_THRESHOLDS
+    assert config not in db_session
+    # A freshly created (uncommitted) config is not cached
+    assert repo_module._CACHE is None
+
+
+@pytest.mark.asyncio
+async def test_get_active_served_from_cache(db_session, config_repo):
+    await config_repo.get_active()  # creates defaults
+    await db_session.commit()
+    first = await config_repo.get_active()  # reads and caches
+
+    # A row written behind the repository's back is not seen until the TTL lapses
+    await db_session.execute(
+        insert(ScoringConfig).values(
+            weights={"urgency": 1.0}, thresholds=DEFAULT_THRESHOLDS, updated_at=_later()
+        )
+    )
+    cached = await config_repo.get_active()
+    assert cached.id == first.id
+
+    with patch.object(repo_module, "_CACHE_TTL", 0.0):
+        assert (await config_repo.get_active()).id != first.id
+
+
+@pytest.mark.asyncio
+async def test_cache_miss_and_hit_both_return_copies(db_session, config_repo):
+    await config_repo.get_active()
+    await db_session.commit()
+
+    miss = await config_repo.get_active()
+    hit = await config_repo.get_active()
+
+    assert miss not in db_session
+    assert hit not in db_session
+    assert miss.id == hit.id
+
+
+@pytest.mark.asyncio
+async def test_cached_config_is_a_copy(db_session, config_repo):
+    await config_repo.get_active()
+    await db_session.commit()
+    config = await config_repo.get_active()
+
+    config.weights["urgency"] = 0.99
+
+    assert (await config_repo.get_active()).weights == DEFAULT_WEIGHTS
+
+
+@pytest.mark.asyncio
+async def test_create_invalidates_cache_on_commit(db_session, config_repo):
+    await config_repo.get_active()
+    await db_session.commit()
+    await config_repo.get_active()
+    assert repo_module._CACHE is not None
+
+    created = await config_repo.create(
+        weights={"urgency": 1.0}, thresholds=DEFAULT_THRESHOLDS, updated_at=_later()
+    )
+
+    # Other sessions keep the committed config until this write commits, while
+    # this session already sees its own write and doesn't re-cache it
+    assert repo_module._CACHE is not None
+    assert (await config_repo.get_active()).id == created.id
+    assert repo_module._CACHE[0].id != created.id
+
+    await db_session.commit()
+
+    assert repo_module._CACHE is None
+    assert (await config_repo.get_active()).id == created.id
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_create_never_cached(db_session, config_repo):
+    await config_repo.get_active()
+    await db_session.commit()
+    committed = await config_repo.get_active()
+
+    await config_repo.create(
+        weights={"urgency": 1.0}, thresholds=DEFAULT_THRESHOLDS, updated_at=_later()
+    )
+    await config_repo.get_active()
+    await db_session.rollback()
+
+    assert repo_module._CACHE[0].id == committed.id
+    assert (await config_repo.get_active()).id == committed.id
@@ -14,28 +14,51 @@ from app.services.scoring_config_service import (
 )
 
 
-@pytest.fixture
+# One set of mocks per module, reset after each test rather than rebuilt
+@pytest.fixture(scope="module")
 def mock_session():
     return AsyncMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_config_repo():
     return AsyncMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scoring_service(mock_session, mock_config_repo):
     service = ScoringConfigService(mock_session)
     service.config_repo = mock_config_repo
     return service
 
 
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_session, mock_config_repo):
+    yield
+    for m in (mock_session, mock_config_repo):
+        m.reset_mock(return_value=True, side_effect=True)
+
+
+_DEFAULT_WEIGHTS = {"industry": 0.3, "budget": 0.3, "urgency": 0.2, "company_size": 0.2}
+_DEFAULT_THRESHOLDS = {"hot": 70, "warm": 40, "cold": 0}
+
+# The service copies weights/thresholds before changing them, so tests that
+# don't need custom values can share one instance
+_DEFAULT_CONFIG = ScoringConfig(
+    id=uuid.uuid4(),
+    weights=_DEFAULT_WEIGHTS,
+    thresholds=_DEFAULT_THRESHOLDS,
+    updated_by="system",
+)
+
+
 def _make_config(weights=None, thresholds=None):
+    if weights is None and thresholds is None:
+        return _DEFAULT_CONFIG
     return ScoringConfig(
         id=uuid.uuid4(),
-        weights=weights or {"industry": 0.3, "budget": 0.3, "urgency": 0.2, "company_size": 0.2},
-        thresholds=thresholds or {"hot": 70, "warm": 40, "cold": 0},
+        weights=weights or _DEFAULT_WEIGHTS,
+        thresholds=thresholds or _DEFAULT_THRESHOLDS,
         updated_by="system",
     )
 
@@ -105,95 +128,44 @@ async def test_update_config_no_changes(scoring_service, mock_config_repo):
 # --- update_weights_from_feedback (EMA learning) ---
 
 
+@pytest.mark.parametrize(
+    "outcome,lead_score,weights,adjusts",
+    [
+        # Positive outcome + low score (false negative) → weights increase
+        ("booked_demo", 30, None, True),
+        # Negative outcome + high score (false positive) → weights decrease
+        ("no_response", 85, None, True),
+        # Positive outcome + high score → correctly predicted, no adjustment
+        ("booked_demo", 85, None, False),
+        # Unknown outcome type → no adjustment
+        ("some_unknown_outcome", 50, None, False),
+        # Very small weights must not drop below the 0.01 floor
+        ("disqualified", 90, {"a": 0.01, "b": 0.01, "c": 0.49, "d": 0.49}, True),
+    ],
+    ids=["false_negative", "false_positive", "aligned", "irrelevant_outcome", "weights_floor"],
+)
 @pytest.mark.asyncio
-async def test_feedback_positive_outcome_low_score_increases_weights(scoring_service, mock_config_repo):
-    """Positive outcome + low score (false negative) → weights increase."""
-    current = _make_config(
-        weights={"industry": 0.3, "budget": 0.3, "urgency": 0.2, "company_size": 0.2}
-    )
-    mock_config_repo.get_active.return_value = current
-    mock_config_repo.create.return_value = _make_config()
-
-    result = await scoring_service.update_weights_from_feedback(
-        outcome="booked_demo",  # positive
-        lead_score=30,  # below warm threshold (40) → false negative
-    )
-
-    # update_config should have been called with adjusted weights
-    mock_config_repo.create.assert_called_once()
-    kwargs = mock_config_repo.create.call_args.kwargs
-    # Weights should be normalized to sum to ~1.0
-    total = sum(kwargs["weights"].values())
-    assert abs(total - 1.0) < 0.01
-
-
-@pytest.mark.asyncio
-async def test_feedback_negative_outcome_high_score_decreases_weights(scoring_service, mock_config_repo):
-    """Negative outcome + high score (false positive) → weights decrease."""
-    weights = {"industry": 0.3, "budget": 0.3, "urgency": 0.2, "company_size": 0.2}
+async def test_feedback(scoring_service, mock_config_repo, outcome, lead_score, weights, adjusts):
     current = _make_config(weights=weights)
     mock_config_repo.get_active.return_value = current
     mock_config_repo.create.return_value = _make_config()
 
-    await scoring_service.update_weights_from_feedback(
-        outcome="no_response",  # negative
-        lead_score=85,  # above hot threshold (70) → false positive
-    )
-
-    mock_config_repo.create.assert_called_once()
-    kwargs = mock_config_repo.create.call_args.kwargs
-    total = sum(kwargs["weights"].values())
-    assert abs(total - 1.0) < 0.01
-
-
-@pytest.mark.asyncio
-async def test_feedback_aligned_no_adjustment(scoring_service, mock_config_repo):
-    """Positive outcome + high score → no adjustment needed."""
-    current = _make_config()
-    mock_config_repo.get_active.return_value = current
-
-    result = await scoring_service.update_weights_from_feedback(
-        outcome="booked_demo",  # positive
-        lead_score=85,  # high score → correctly predicted
-    )
-
-    # Should return current config without creating new one
-    mock_config_repo.create.assert_not_called()
-    assert result == current
-
-
-@pytest.mark.asyncio
-async def test_feedback_irrelevant_outcome_skips(scoring_service, mock_config_repo):
-    """Unknown outcome type → no adjustment."""
-    current = _make_config()
-    mock_config_repo.get_active.return_value = current
-
     result = await scoring_service.update_weights_from_feedback(
-        outcome="some_unknown_outcome",
-        lead_score=50,
+        outcome=outcome,
+        lead_score=lead_score,
     )
 
-    mock_config_repo.create.assert_not_called()
-    assert result == current
-
-
-@pytest.mark.asyncio
-async def test_feedback_weights_stay_positive(scoring_service, mock_config_repo):
-    """Weights should never go below 0.01 after adjustment."""
-    # Start with very small weights
-    weights = {"a": 0.01, "b": 0.01, "c": 0.49, "d": 0.49}
-    current = _make_config(weights=weights)
-    mock_config_repo.get_active.return_value = current
-    mock_config_repo.create.return_value = _make_config()
-
-    await scoring_service.update_weights_from_feedback(
-        outcome="disqualified",  # negative
-        lead_score=90,  # high score → false positive → decrease
-    )
+    if not adjusts:
+        # Current config returned without creating a new version
+        mock_config_repo.create.assert_not_called()
+        assert result == current
+        return
 
-    kwargs = mock_config_repo.create.call_args.kwargs
-    for v in kwargs["weights"].values():
-        assert v >= 0.01
+    mock_config_repo.create.assert_called_once()
+    new_weights = mock_config_repo.create.call_args.kwargs["weights"]
+    # Weights are renormalized to sum to ~1.0 and stay above the floor
+    assert abs(sum(new_weights.values()) - 1.0) < 0.01
+    assert min(new_weights.values()) >= 0.01
 
 
 # --- Outcome sets ---
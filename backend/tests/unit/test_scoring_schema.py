@@ -39,64 +39,55 @@ def test_score_value_in_range():
     assert score_max.score_value == 100
 
 
-def test_score_out_of_range_high():
-    """Test score value > 100 raises ValidationError."""
+@pytest.mark.parametrize(
+    "kwargs,err_field",
+    [
+        pytest.param(
+            {
+                "score_value": 101,
+                "score_label": ScoreLabel.HOT,
+                "rationale": "This score is too high.",
+            },
+            "score_value",
+            id="score_too_high",
+        ),
+        pytest.param(
+            {
+                "score_value": -1,
+                "score_label": ScoreLabel.COLD,
+                "rationale": "This score is too low.",
+            },
+            "score_value",
+            id="score_too_low",
+        ),
+        pytest.param(
+            {
+                "score_value": 50,
+                "score_label": "INVALID_LABEL",
+                "rationale": "This has an invalid label.",
+            },
+            "score_label",
+            id="invalid_label",
+        ),
+        pytest.param(
+            # Less than 10 characters
+            {"score_value": 50, "score_label": ScoreLabel.WARM, "rationale": "Too short"},
+            "rationale",
+            id="short_rationale",
+        ),
+        pytest.param(
+            {"score_value": 75, "score_label": ScoreLabel.HOT},
+            "rationale",
+            id="missing_rationale",
+        ),
+    ],
+)
+def test_score_invalid(kwargs, err_field):
+    """Test invalid score results raise ValidationError naming the bad field."""
     with pytest.raises(ValidationError) as exc_info:
-        ScoreResult(
-            score_value=101,
-            score_label=ScoreLabel.HOT,
-            rationale="This score is too high.",
-        )
-
-    assert "score_value" in str(exc_info.value)
-
-
-def test_score_out_of_range_low():
-    """Test score value < 0 raises ValidationError."""
-    with pytest.raises(ValidationError) as exc_info:
-        ScoreResult(
-            score_value=-1,
-            score_label=ScoreLabel.COLD,
-            rationale="This score is too low.",
-        )
-
-    assert "score_value" in str(exc_info.value)
-
-
-def test_score_invalid_label():
-    """Test invalid score label raises ValidationError."""
-    with pytest.raises(ValidationError) as exc_info:
-        ScoreResult(
-            score_value=50,
-            score_label="INVALID_LABEL",  # type: ignore
-            rationale="This has an invalid label.",
-        )
+        ScoreResult(**kwargs)
 
-    assert "score_label" in str(exc_info.value)
-
-
-def test_score_short_rationale():
-    """Test rationale too short raises ValidationError."""
-    with pytest.raises(ValidationError) as exc_info:
-        ScoreResult(
-            score_value=50,
-            score_label=ScoreLabel.WARM,
-            rationale="Too short",  # Less than 10 characters
-        )
-
-    assert "rationale" in str(exc_info.value)
-
-
-def test_score_missing_fields():
-    """Test missing required fields raise ValidationError."""
-    with pytest.raises(ValidationError) as exc_info:
-        ScoreResult(
-            score_value=75,
-            score_label=ScoreLabel.HOT,
-            # Missing rationale
-        )  # type: ignore
-
-    assert "rationale" in str(exc_info.value)
+    assert err_field in str(exc_info.value)
 
 
 def test_score_labels_mapping():
@@ -112,7 +103,8 @@ def test_score_labels_mapping():
 
 def test_score_to_dict():
     """Test ScoreResult can be converted to dict."""
-    score = ScoreResult(
+    # Serialization only; validation is covered above
+    score = ScoreResult.model_construct(
         score_value=80,
         score_label=ScoreLabel.HOT,
         rationale="Test conversion to dictionary format.",
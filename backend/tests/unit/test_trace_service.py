@@ -9,87 +9,102 @@ from app.models.orm import Trace
 from app.services.trace_service import TraceService
 
 
-@pytest.fixture
+# One set of mocks per module, reset after each test rather than rebuilt
+@pytest.fixture(scope="module")
 def mock_session():
     return AsyncMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_trace_repo():
     return AsyncMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def trace_service(mock_session, mock_trace_repo):
     service = TraceService(mock_session)
     service.trace_repo = mock_trace_repo
     return service
 
 
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_session, mock_trace_repo):
+    yield
+    for m in (mock_session, mock_trace_repo):
+        m.reset_mock(return_value=True, side_effect=True)
+
+
 # --- PII redaction ---
 
 
-def test_redact_pii_simple_email():
-    service = TraceService(AsyncMock())
+def test_redact_pii_simple_email(trace_service):
     data = {"prompt": "Contact john@example.com for details"}
-    result = service._redact_pii(data)
+    result = trace_service._redact_pii(data)
 
     assert "john@example.com" not in result["prompt"]
     assert "REDACTED_" in result["prompt"]
 
 
-def test_redact_pii_nested_dict():
-    service = TraceService(AsyncMock())
+def test_redact_pii_nested_dict(trace_service):
     data = {
         "outer": {
             "inner": "Send to jane.doe@company.io please"
         }
     }
-    result = service._redact_pii(data)
+    result = trace_service._redact_pii(data)
 
     assert "jane.doe@company.io" not in result["outer"]["inner"]
     assert "REDACTED_" in result["outer"]["inner"]
 
 
-def test_redact_pii_list_values():
-    service = TraceService(AsyncMock())
+def test_redact_pii_list_values(trace_service):
     data = {
         "emails": ["alice@test.com", "bob@test.com"]
     }
-    result = service._redact_pii(data)
+    result = trace_service._redact_pii(data)
 
     assert "alice@test.com" not in result["emails"][0]
     assert "bob@test.com" not in result["emails"][1]
     assert all("REDACTED_" in item for item in result["emails"])
 
 
-def test_redact_pii_preserves_non_email():
-    service = TraceService(AsyncMock())
+def test_redact_pii_nested_lists_and_repeats(trace_service):
+    data = {
+        "messages": [["system", "Lead is sam@acme.com"], {"content": "Lead is sam@acme.com"}],
+        "prompt": "Lead is sam@acme.com",
+    }
+    result = trace_service._redact_pii(data)
+
+    redacted = result["prompt"]
+    assert "sam@acme.com" not in redacted
+    assert result["messages"] == [["system", redacted], {"content": redacted}]
+    # Input is left untouched
+    assert data["messages"][0][1] == "Lead is sam@acme.com"
+
+
+def test_redact_pii_preserves_non_email(trace_service):
     data = {"name": "John Doe", "count": 42, "flag": True}
-    result = service._redact_pii(data)
+    result = trace_service._redact_pii(data)
 
     assert result["name"] == "John Doe"
     assert result["count"] == 42
     assert result["flag"] is True
 
 
-def test_redact_pii_multiple_emails_in_string():
-    service = TraceService(AsyncMock())
+def test_redact_pii_multiple_emails_in_string(trace_service):
     data = {"text": "CC: a@b.com and c@d.com"}
-    result = service._redact_pii(data)
+    result = trace_service._redact_pii(data)
 
     assert "a@b.com" not in result["text"]
     assert "c@d.com" not in result["text"]
 
 
-def test_redact_pii_string_returns_unchanged_for_none():
-    service = TraceService(AsyncMock())
-    assert service._redact_pii_string(None) is None
+def test_redact_pii_string_returns_unchanged_for_none(trace_service):
+    assert trace_service._redact_pii_string(None) is None
 
 
-def test_redact_pii_empty_dict():
-    service = TraceService(AsyncMock())
-    assert service._redact_pii({}) == {}
+def test_redact_pii_empty_dict(trace_service):
+    assert trace_service._redact_pii({}) == {}
 
 
 # --- hash_email ---
@@ -137,7 +152,8 @@ async def test_create_trace_redacts_llm_inputs(trace_service, mock_trace_repo):
     mock_trace_repo.create.assert_called_once()
     kwargs = mock_trace_repo.create.call_args.kwargs
     # llm_inputs should be redacted
-    assert "john@acme.com" not in str(kwargs["llm_inputs"])
+    prompt = kwargs["llm_inputs"]["prompt"]
+    assert prompt == f"Score lead REDACTED_{TraceService.hash_email('john@acme.com')[:16]}"
     # llm_outputs should be passed through as-is
     assert kwargs["llm_outputs"] == {"score": 85}
     # node_events passed through
@@ -23,13 +23,68 @@ backend_dir = Path(__file__).parent.parent / "backend"
 if backend_dir.exists():
     sys.path.insert(0, str(backend_dir))
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 from app.models.orm import Base, Lead, ScoringConfig, User
 
-
-async def hash_api_key(api_key: str) -> str:
+# Leading characters spreadsheet apps treat as formulas
+CSV_INJECTION_PREFIXES = ('=', '+', '-', '@')
+
+# Lead column -> max length kept from the CSV value
+FIELD_LIMITS = {
+    'first_name': 100,
+    'last_name': 100,
+    'email': 255,
+    'phone': 50,
+    'company_name': 200,
+    'job_title': 100,
+    'industry': 100,
+    'company_size': 50,
+    'country': 100,
+    'source': 100,
+    'budget_range': 50,
+    'pain_point': 500,
+    'urgency': 20,
+    'lead_message': 2000,
+}
+
+# Default scoring config written by the seed
+DEFAULT_SCORING_WEIGHTS = {
+    "budget_weight": 0.3,
+    "urgency_weight": 0.25,
+    "company_size_weight": 0.2,
+    "industry_weight": 0.15,
+    "source_weight": 0.1,
+    "budget_scores": {
+        "under_10k": 10, "10k-25k": 30, "25k-50k": 50,
+        "50k-100k": 75, "over_100k": 100
+    },
+    "urgency_scores": {"low": 20, "medium": 60, "high": 100},
+    "company_size_scores": {
+        "1-10": 20, "11-50": 40, "51-200": 60, "201-500": 80,
+        "501-1000": 90, "1001-5000": 95, "5000+": 100
+    },
+    "industry_scores": {
+        "SaaS": 90, "Fintech": 85, "Healthcare": 80,
+        "Manufacturing": 70, "Retail": 65, "Education": 60, "Other": 50
+    },
+    "source_scores": {
+        "referral": 100, "partner": 90, "website": 80, "webinar": 75,
+        "conference": 70, "linkedin": 65, "google_ads": 60,
+        "trade_show": 55, "cold_email": 40, "other": 30
+    },
+}
+
+DEFAULT_SCORING_THRESHOLDS = {
+    "hot_threshold": 75,
+    "warm_threshold": 50,
+    "cold_threshold": 25
+}
+
+
+def hash_api_key(api_key: str) -> str:
     """Hash an API key for storage."""
     return hashlib.sha256(api_key.encode()).hexdigest()
 
@@ -58,7 +113,7 @@ async def seed_database():
         # 1. Create default admin user
         print("\n[1/3] Creating default admin user...")
 
-        api_key_hash = await hash_api_key("dev-api-key-change-me")
+        api_key_hash = hash_api_key("dev-api-key-change-me")
         admin_user = User(
             email="admin@leadops.dev",
             name="Admin User",
@@ -73,36 +128,8 @@ async def seed_database():
         print("\n[2/3] Creating default scoring config...")
 
         scoring_config = ScoringConfig(
-            weights={
-                "budget_weight": 0.3,
-                "urgency_weight": 0.25,
-                "company_size_weight": 0.2,
-                "industry_weight": 0.15,
-                "source_weight": 0.1,
-                "budget_scores": {
-                    "under_10k": 10, "10k-25k": 30, "25k-50k": 50,
-                    "50k-100k": 75, "over_100k": 100
-                },
-                "urgency_scores": {"low": 20, "medium": 60, "high": 100},
-                "company_size_scores": {
-                    "1-10": 20, "11-50": 40, "51-200": 60, "201-500": 80,
-                    "501-1000": 90, "1001-5000": 95, "5000+": 100
-                },
-                "industry_scores": {
-                    "SaaS": 90, "Fintech": 85, "Healthcare": 80,
-                    "Manufacturing": 70, "Retail": 65, "Education": 60, "Other": 50
-                },
-                "source_scores": {
-                    "referral": 100, "partner": 90, "website": 80, "webinar": 75,
-                    "conference": 70, "linkedin": 65, "google_ads": 60,
-                    "trade_show": 55, "cold_email": 40, "other": 30
-                },
-            },
-            thresholds={
-                "hot_threshold": 75,
-                "warm_threshold": 50,
-                "cold_threshold": 25
-            },
+            weights=DEFAULT_SCORING_WEIGHTS,
+            thresholds=DEFAULT_SCORING_THRESHOLDS,
         )
         session.add(scoring_config)
         await session.flush()
@@ -117,7 +144,7 @@ async def seed_database():
             print(f"CSV file not found at {csv_path}")
             return
 
-        leads_created = 0
+        rows: list[dict] = []
         leads_skipped = 0
 
         with open(csv_path, 'r', encoding='utf-8') as f:
@@ -126,7 +153,7 @@ async def seed_database():
             for row in reader:
                 try:
                     # Skip CSV injection attempts (leading =, +, -, @)
-                    if any(row.get('first_name', '').startswith(c) for c in ['=', '+', '-', '@']):
+                    if row.get('first_name', '').startswith(CSV_INJECTION_PREFIXES):
                         print(f"Skipping potential CSV injection: {row.get('email', 'unknown')}")
                         leads_skipped += 1
                         continue
@@ -137,40 +164,25 @@ async def seed_database():
                         leads_skipped += 1
                         continue
 
-                    # Create lead
-                    lead = Lead(
-                        first_name=row['first_name'][:100],
-                        last_name=row['last_name'][:100],
-                        email=row['email'][:255],
-                        phone=row.get('phone', '')[:50] or None,
-                        company_name=row.get('company_name', '')[:200] or 'Unknown',
-                        job_title=row.get('job_title', '')[:100] or None,
-                        industry=row.get('industry', '')[:100] or None,
-                        company_size=row.get('company_size', '')[:50] or None,
-                        country=row.get('country', '')[:100] or None,
-                        source=row.get('source', '')[:100] or None,
-                        budget_range=row.get('budget_range', '')[:50] or None,
-                        pain_point=row.get('pain_point', '')[:500] or None,
-                        urgency=row.get('urgency', '')[:20] or None,
-                        lead_message=row.get('lead_message', '')[:2000] or None,
-                        status='new',
-                    )
-
-                    session.add(lead)
-                    leads_created += 1
-
-                    # Batch commit every 50 leads for performance
-                    if leads_created % 50 == 0:
-                        await session.commit()
-                        print(f"  ... {leads_created} leads created so far")
+                    # Collect plain rows; they are inserted in one batch below
+                    lead = {
+                        field: row.get(field, '')[:limit] or None
+                        for field, limit in FIELD_LIMITS.items()
+                    }
+                    lead['company_name'] = lead['company_name'] or 'Unknown'
+                    lead['status'] = 'new'
+                    rows.append(lead)
 
                 except Exception as e:
                     print(f"Error creating lead from row {row}: {e}")
                     leads_skipped += 1
                     continue
 
-        # Final commit for remaining leads
+        # Single executemany INSERT instead of one ORM object and flush per lead
+        if rows:
+            await session.execute(insert(Lead), rows)
         await session.commit()
+        leads_created = len(rows)
 
         print(f"\nSuccessfully created {leads_created} leads")
         if leads_skipped > 0: